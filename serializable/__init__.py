@@ -17,14 +17,18 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) Paul Horton. All Rights Reserved.
 
-from copy import copy
+import builtins
 from decimal import Decimal
 from enum import Enum, EnumMeta, unique
-from inspect import getfullargspec, getmembers, isclass
-from io import StringIO, TextIOBase
-from json import JSONEncoder, dumps as json_dumps
+from functools import partial
+from inspect import isclass
+from io import TextIOBase
+from itertools import groupby
+from json import JSONEncoder
 from logging import NullHandler, getLogger
-from re import compile as re_compile, search as re_search
+from operator import attrgetter
+from re import compile as re_compile
+from sys import intern
 from typing import (
     Any,
     Callable,
@@ -42,7 +46,7 @@ from typing import (
     cast,
     overload,
 )
-from xml.etree.ElementTree import Element, SubElement
+from xml.etree.ElementTree import Element, SubElement, tostring as xml_tostring
 
 from defusedxml import ElementTree as SafeElementTree  # type:ignore[import-untyped]
 
@@ -55,9 +59,6 @@ from .xml import xs_normalizedString, xs_token
 # see https://github.com/python/typing/issues/213
 from typing import Union as Intersection  # isort: skip
 
-# MUST import the whole thing to get some eval/hacks working for dynamic type detection.
-import typing  # noqa: F401 # isort: skip
-
 # !! version is managed by semantic_release
 # do not use typing here, or else `semantic_release` might have issues finding the variable
 __version__ = '1.1.2'
@@ -154,6 +155,10 @@ class XmlStringSerializationType(Enum):
     # - https://www.w3.org/TR/xmlschema-2/#Name
 
 
+# `Enum.value` is a Python-level descriptor; `_value_` is the plain instance attribute it reads from
+_enum_value: Callable[[Enum], Any] = attrgetter('_value_')
+_element_tag: Callable[[Element], str] = attrgetter('tag')
+
 # region _xs_string_mod_apply
 
 __XS_STRING_MODS: Dict[XmlStringSerializationType, Callable[[str], str]] = {
@@ -163,7 +168,9 @@ __XS_STRING_MODS: Dict[XmlStringSerializationType, Callable[[str], str]] = {
 
 
 def _xs_string_mod_apply(v: str, t: Optional[XmlStringSerializationType]) -> str:
-    mod = __XS_STRING_MODS.get(t)  # type: ignore[arg-type]
+    if t is None:
+        return v
+    mod = __XS_STRING_MODS.get(t)
     return mod(v) if mod else v
 
 
@@ -172,28 +179,554 @@ def _xs_string_mod_apply(v: str, t: Optional[XmlStringSerializationType]) -> str
 
 def _allow_property_for_view(prop_info: 'ObjectMetadataLibrary.SerializableProperty', value_: Any,
                              view_: Optional[Type[ViewType]]) -> bool:
-    # First check Property is part of the View is given
-    allow_for_view = False
-    if view_:
-        if prop_info.views and view_ in prop_info.views:
-            allow_for_view = True
-        elif not prop_info.views:
-            allow_for_view = True
+    allow_for_view, allow_none_for_view = prop_info.view_flags(view_)
+    if value_ is None or (prop_info.is_array and len(value_) < 1):
+        return allow_none_for_view
+    return allow_for_view
+
+
+# region _klass_qualified_name
+
+__KLASS_QUALIFIED_NAMES: Dict[type, str] = {}
+
+
+def _klass_qualified_name(klass: type) -> str:
+    """The key a class is registered under in the `ObjectMetadataLibrary` - memoized per class."""
+    try:
+        return __KLASS_QUALIFIED_NAMES[klass]
+    except KeyError:
+        name = __KLASS_QUALIFIED_NAMES[klass] = f'{klass.__module__}.{klass.__qualname__}'
+        return name
+
+
+__KLASS_GLOBAL_NAMES: Dict[type, str] = {}
+
+
+def _is_registered_klass(klass: type) -> bool:
+    """Whether a Property's concrete type is a class registered with the `ObjectMetadataLibrary`.
+
+    Looked up by `module.__name__` rather than the qualified name, as it always has been for Property types.
+    """
+    try:
+        name = __KLASS_GLOBAL_NAMES[klass]
+    except KeyError:
+        name = __KLASS_GLOBAL_NAMES[klass] = f'{klass.__module__}.{klass.__name__}'
+    return name in ObjectMetadataLibrary.klass_mappings
+
+
+# endregion _klass_qualified_name
+
+
+# region JSON value converters
+# Which of these converts a Property's value does not change between calls - the JSON plan of a class picks them once.
+
+_JsonConverter = Callable[[Any, 'ObjectMetadataLibrary.SerializableProperty', Optional[Type[ViewType]], type], Any]
+"""(value, property info, view, class) -> JSON value"""
+
+
+def _json_convert_helper(v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                         view_: Optional[Type[ViewType]], ctx: type) -> Any:
+    return prop_info.custom_type.json_normalize(  # type:ignore[union-attr]
+        v, view=view_, prop_info=prop_info, ctx=ctx)
+
+
+def _json_convert_custom_type(v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                              view_: Optional[Type[ViewType]], ctx: type) -> Any:
+    return prop_info.custom_type(v)  # type:ignore[misc]
+
+
+def _json_convert_array(v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                        view_: Optional[Type[ViewType]], ctx: type) -> Any:
+    return list(v) if len(v) > 0 else None
+
+
+def _json_convert_enum(v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                       view_: Optional[Type[ViewType]], ctx: type) -> Any:
+    return str(_enum_value(v))
+
+
+def _json_convert_decimal(v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                          view_: Optional[Type[ViewType]], ctx: type) -> Any:
+    if isinstance(v, Decimal):
+        if prop_info.string_format:
+            return float(f'{v:{prop_info.string_format}}')
+        return float(v)
+    return v
+
+
+def _json_convert_formatted(v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                            view_: Optional[Type[ViewType]], ctx: type) -> Any:
+    if isinstance(v, Decimal):
+        return _json_convert_decimal(v, prop_info, view_, ctx)
+    if prop_info.string_format:
+        return f'{v:{prop_info.string_format}}'
+    return str(v)
+
+
+def _json_converter(prop_info: 'ObjectMetadataLibrary.SerializableProperty') -> Optional[_JsonConverter]:
+    """The converter for a Property's values - `None` if they are rendered as they are."""
+    if prop_info.custom_type:
+        if prop_info.is_helper_type():
+            return _json_convert_helper
+        return _json_convert_custom_type
+    if prop_info.is_array:
+        return _json_convert_array
+    if prop_info.is_enum:
+        return _json_convert_enum
+    if not prop_info.is_primitive_type():
+        if _is_registered_klass(prop_info.concrete_type):
+            # nested objects are handled by the encoder - only Decimals need converting
+            return _json_convert_decimal
+        return _json_convert_formatted
+    return None
+
+
+# endregion JSON value converters
+
+
+# region XML element emitters
+# Which of these renders a Property does not change between calls - the XML plan of a class picks them once.
+
+_XmlEmitter = Callable[
+    [Element, str, Any, 'ObjectMetadataLibrary.SerializableProperty', Optional[str], Optional[Type[ViewType]],
+     Optional[str], type],
+    None]
+"""(parent element, namespaced tag, value, property info, namespaced array item tag, view, xmlns, class)"""
+
+
+def _xml_emit_array(this_e: Element, new_key: str, v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                    nested_key: Optional[str], view_: Optional[Type[ViewType]], xmlns: Optional[str],
+                    ctx: type) -> None:
+    nested_key = cast(str, nested_key)
+    _array_type = cast(Tuple[XmlArraySerializationType, str], prop_info.xml_array_config)[0]
+    if _array_type and _array_type == XmlArraySerializationType.NESTED:
+        nested_e = SubElement(this_e, new_key)
+    else:
+        nested_e = this_e
+    if not prop_info.is_primitive_type() and not prop_info.is_enum:
+        for j in v:
+            nested_e.append(
+                j.as_xml(view_=view_, as_string=False, element_name=nested_key, xmlns=xmlns))
+        return
+    # The item type is the same for all items - pick the text conversion once, not per item
+    texts: Iterable[str]
+    if prop_info.is_enum:
+        texts = (_xs_string_mod_apply(str(j), prop_info.xml_string_config) for j in map(_enum_value, v))
+    elif prop_info.concrete_type in (float, int):
+        texts = map(str, v)
+    elif prop_info.concrete_type is bool:
+        texts = (str(j).lower() for j in v)
+    else:
+        # Assume type is str
+        texts = (_xs_string_mod_apply(str(j), prop_info.xml_string_config) for j in v)
+    for text in texts:
+        SubElement(nested_e, nested_key).text = text
+
+
+def _xml_emit_helper(this_e: Element, new_key: str, v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                     nested_key: Optional[str], view_: Optional[Type[ViewType]], xmlns: Optional[str],
+                     ctx: type) -> None:
+    v_ser = prop_info.custom_type.xml_normalize(  # type:ignore[union-attr]
+        v, view=view_, element_name=new_key, xmlns=xmlns, prop_info=prop_info, ctx=ctx)
+    if v_ser is None:
+        pass  # skip the element
+    elif isinstance(v_ser, Element):
+        this_e.append(v_ser)
     else:
-        if not prop_info.views:
-            allow_for_view = True
+        SubElement(this_e, new_key).text = _xs_string_mod_apply(str(v_ser), prop_info.xml_string_config)
 
-    # Second check for inclusion of None values
-    if value_ is None or (prop_info.is_array and len(value_) < 1):
-        if not prop_info.include_none:
-            allow_for_view = False
-        elif prop_info.include_none and prop_info.include_none_views:
-            allow_for_view = False
-            for _v, _a in prop_info.include_none_views:
-                if _v == view_:
-                    allow_for_view = True
 
-    return allow_for_view
+def _xml_emit_custom_type(this_e: Element, new_key: str, v: Any,
+                          prop_info: 'ObjectMetadataLibrary.SerializableProperty', nested_key: Optional[str],
+                          view_: Optional[Type[ViewType]], xmlns: Optional[str], ctx: type) -> None:
+    SubElement(this_e, new_key).text = _xs_string_mod_apply(str(prop_info.custom_type(v)),  # type:ignore[misc]
+                                                            prop_info.xml_string_config)
+
+
+def _xml_emit_enum(this_e: Element, new_key: str, v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                   nested_key: Optional[str], view_: Optional[Type[ViewType]], xmlns: Optional[str],
+                   ctx: type) -> None:
+    SubElement(this_e, new_key).text = _xs_string_mod_apply(str(_enum_value(v)), prop_info.xml_string_config)
+
+
+def _xml_emit_serializable(this_e: Element, new_key: str, v: Any,
+                           prop_info: 'ObjectMetadataLibrary.SerializableProperty', nested_key: Optional[str],
+                           view_: Optional[Type[ViewType]], xmlns: Optional[str], ctx: type) -> None:
+    # Handle other Serializable Classes
+    this_e.append(v.as_xml(view_=view_, as_string=False, element_name=new_key, xmlns=xmlns))
+
+
+def _xml_emit_formatted(this_e: Element, new_key: str, v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                        nested_key: Optional[str], view_: Optional[Type[ViewType]], xmlns: Optional[str],
+                        ctx: type) -> None:
+    SubElement(this_e, new_key).text = _xs_string_mod_apply(f'{v:{prop_info.string_format}}',
+                                                            prop_info.xml_string_config)
+
+
+def _xml_emit_str(this_e: Element, new_key: str, v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                  nested_key: Optional[str], view_: Optional[Type[ViewType]], xmlns: Optional[str],
+                  ctx: type) -> None:
+    SubElement(this_e, new_key).text = _xs_string_mod_apply(str(v), prop_info.xml_string_config)
+
+
+def _xml_emit_number(this_e: Element, new_key: str, v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                     nested_key: Optional[str], view_: Optional[Type[ViewType]], xmlns: Optional[str],
+                     ctx: type) -> None:
+    SubElement(this_e, new_key).text = str(v)
+
+
+def _xml_emit_bool(this_e: Element, new_key: str, v: Any, prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                   nested_key: Optional[str], view_: Optional[Type[ViewType]], xmlns: Optional[str],
+                   ctx: type) -> None:
+    SubElement(this_e, new_key).text = str(v).lower()
+
+
+def _xml_emitter(prop_info: 'ObjectMetadataLibrary.SerializableProperty') -> _XmlEmitter:
+    if prop_info.is_array and prop_info.xml_array_config:
+        return _xml_emit_array
+    if prop_info.custom_type:
+        if prop_info.is_helper_type():
+            return _xml_emit_helper
+        return _xml_emit_custom_type
+    if prop_info.is_enum:
+        return _xml_emit_enum
+    if not prop_info.is_primitive_type():
+        if _is_registered_klass(prop_info.concrete_type):
+            return _xml_emit_serializable
+        # Handle properties that have a type that is not a Python Primitive (e.g. int, float, str)
+        if prop_info.string_format:
+            return _xml_emit_formatted
+        return _xml_emit_str
+    if prop_info.concrete_type in (float, int):
+        return _xml_emit_number
+    if prop_info.concrete_type is bool:
+        return _xml_emit_bool
+    # Assume type is str
+    return _xml_emit_str
+
+
+# endregion XML element emitters
+
+
+# region XML element readers
+# Which of these reads a Property does not change between calls - they are picked once per class.
+
+_XmlReader = Callable[
+    [Dict[str, Any], str, Element, 'ObjectMetadataLibrary.SerializableProperty', Optional[str],
+     'ObjectMetadataLibrary.SerializableClass'],
+    None]
+"""(data being collected, property name, element, property info, default namespace, class metadata)"""
+
+
+def _xml_read_nested_array(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                           prop_info: 'ObjectMetadataLibrary.SerializableProperty', default_namespace: Optional[str],
+                           klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    items = _data.setdefault(decoded_k, [])
+    is_object = not prop_info.is_primitive_type() and not prop_info.is_enum
+    for sub_child_e in child_e:
+        if sub_child_e.text:
+            sub_child_e.text = _xs_string_mod_apply(sub_child_e.text, prop_info.xml_string_config)
+        if is_object:
+            items.append(prop_info.concrete_type.from_xml(data=sub_child_e, default_namespace=default_namespace))
+        else:
+            items.append(prop_info.concrete_type(sub_child_e.text))
+
+
+def _xml_read_flat_array_object(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                                prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                                default_namespace: Optional[str],
+                                klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    _data.setdefault(decoded_k, []).append(
+        prop_info.concrete_type.from_xml(data=child_e, default_namespace=default_namespace))
+
+
+def _xml_read_flat_array_value(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                               prop_info: 'ObjectMetadataLibrary.SerializableProperty',
+                               default_namespace: Optional[str],
+                               klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    _data.setdefault(decoded_k, []).append(prop_info.concrete_type(child_e.text))
+
+
+def _xml_read_helper(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                     prop_info: 'ObjectMetadataLibrary.SerializableProperty', default_namespace: Optional[str],
+                     klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    _data[decoded_k] = prop_info.custom_type.xml_denormalize(  # type:ignore[union-attr]
+        child_e, default_ns=default_namespace, prop_info=prop_info, ctx=klass)
+
+
+def _xml_read_custom_type(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                          prop_info: 'ObjectMetadataLibrary.SerializableProperty', default_namespace: Optional[str],
+                          klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    _data[decoded_k] = prop_info.custom_type(child_e.text)  # type:ignore[misc]
+
+
+def _xml_read_serializable(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                           prop_info: 'ObjectMetadataLibrary.SerializableProperty', default_namespace: Optional[str],
+                           klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    _data[decoded_k] = prop_info.concrete_type.from_xml(data=child_e, default_namespace=default_namespace)
+
+
+def _xml_read_bool(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                   prop_info: 'ObjectMetadataLibrary.SerializableProperty', default_namespace: Optional[str],
+                   klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    _data[decoded_k] = child_e.text in _XML_BOOL_REPRESENTATIONS_TRUE
+
+
+def _xml_read_value(_data: Dict[str, Any], decoded_k: str, child_e: Element,
+                    prop_info: 'ObjectMetadataLibrary.SerializableProperty', default_namespace: Optional[str],
+                    klass: 'ObjectMetadataLibrary.SerializableClass') -> None:
+    _data[decoded_k] = prop_info.concrete_type(child_e.text)
+
+
+def _xml_reader(prop_info: 'ObjectMetadataLibrary.SerializableProperty') -> _XmlReader:
+    if prop_info.is_array and prop_info.xml_array_config:
+        array_type, nested_name = prop_info.xml_array_config
+        if array_type == XmlArraySerializationType.NESTED:
+            return _xml_read_nested_array
+        if not prop_info.is_primitive_type() and not prop_info.is_enum:
+            return _xml_read_flat_array_object
+        if prop_info.custom_type:
+            if prop_info.is_helper_type():
+                return _xml_read_helper
+            return _xml_read_custom_type
+        return _xml_read_flat_array_value
+    if prop_info.custom_type:
+        if prop_info.is_helper_type():
+            return _xml_read_helper
+        return _xml_read_custom_type
+    if prop_info.is_enum:
+        return _xml_read_value
+    if not prop_info.is_primitive_type():
+        if _is_registered_klass(prop_info.concrete_type):
+            return _xml_read_serializable
+        return _xml_read_value
+    if prop_info.concrete_type == bool:
+        return _xml_read_bool
+    return _xml_read_value
+
+
+# endregion XML element readers
+
+
+# region serialization plans
+# Metadata that does not change between calls gets resolved once per class and formatter, and is cached.
+# The caches are reset whenever a class gets registered - see `ObjectMetadataLibrary.register_klass()`.
+
+_JsonPlan = Tuple[Tuple[str, str, 'ObjectMetadataLibrary.SerializableProperty', Optional[_JsonConverter]], ...]
+"""Tuples of (property name, JSON key, property info, value converter)"""
+_XmlPlan = Tuple[Tuple[str, str, str, str, Optional[str], 'ObjectMetadataLibrary.SerializableProperty', _XmlEmitter],
+                 ...]
+"""Tuples of (property name, XML name, namespaced XML name, namespaced formatted XML name,
+namespaced array item name, property info, emitter) - sorted by XML sequence"""
+
+_XmlAttributeKeys = Dict[str, Optional[Tuple[str, str, 'ObjectMetadataLibrary.SerializableProperty']]]
+"""Instance attribute name -> (formatted XML name, namespaced formatted XML name, property info),
+or `None` if it is no XML attribute"""
+
+_XmlPlanKey = Tuple[type, Optional[Type[BaseNameFormatter]], Optional[str]]
+"""(class, formatter, xmlns)"""
+
+_JSON_PLANS: Dict[Tuple[type, Optional[Type[BaseNameFormatter]], Optional[Type[ViewType]]], _JsonPlan] = {}
+_XML_PLANS: Dict[Tuple[type, Optional[Type[BaseNameFormatter]], Optional[str], Optional[Type[ViewType]]], _XmlPlan] = {}
+_XML_ATTRIBUTE_KEYS: Dict[_XmlPlanKey, _XmlAttributeKeys] = {}
+_JSON_CUSTOM_NAMES: Dict[type, Dict[str, str]] = {}
+_XML_CUSTOM_NAMES: Dict[type, Dict[str, str]] = {}
+_JSON_KEYS: Dict[Tuple[type, Optional[Type[BaseNameFormatter]]], Dict[str, Optional[str]]] = {}
+_XML_CHILD_KEYS: Dict[Tuple[type, Optional[Type[BaseNameFormatter]]], Dict[str, Tuple[str, bool]]] = {}
+_XML_READERS: Dict[type, Dict[str, _XmlReader]] = {}
+
+_XML_CHILD_SKIP = '____SKIP_ME____'
+
+
+def _json_plan(klass: type, view_: Optional[Type[ViewType]]) -> _JsonPlan:
+    """Plan for the properties that might be rendered for the View - the ones that never are, are left out."""
+    formatter = CurrentFormatter.formatter
+    plan = _JSON_PLANS.get((klass, formatter, view_))
+    if plan is None:
+        entries = []
+        for k, prop_info in ObjectMetadataLibrary.klass_property_mappings.get(_klass_qualified_name(klass), {}).items():
+            if not any(prop_info.view_flags(view_)):
+                continue
+            new_key = BaseNameFormatter.decode_handle_python_builtins_and_keywords(name=k)
+            if custom_name := prop_info.json_custom_name:
+                new_key = str(custom_name)
+            if formatter:
+                new_key = formatter.encode(property_name=new_key)
+            entries.append((k, new_key, prop_info, _json_converter(prop_info)))
+        plan = _JSON_PLANS[(klass, formatter, view_)] = tuple(entries)
+    return plan
+
+
+def _xml_plan(klass: type, xmlns: Optional[str], view_: Optional[Type[ViewType]]) -> _XmlPlan:
+    """Plan for the properties that might be rendered as XML elements for the View.
+
+    XML attributes, and properties that are never rendered for the View, are left out.
+    """
+    formatter = CurrentFormatter.formatter
+    plan = _XML_PLANS.get((klass, formatter, xmlns, view_))
+    if plan is None:
+        entries = []
+        properties = ObjectMetadataLibrary.klass_property_mappings.get(_klass_qualified_name(klass), {})
+        for k, prop_info in sorted(properties.items(), key=lambda i: i[1].xml_sequence):
+            if prop_info.is_xml_attribute or not any(prop_info.view_flags(view_)):
+                continue
+            new_key = prop_info.xml_custom_name
+            if new_key is None:
+                new_key = BaseNameFormatter.decode_handle_python_builtins_and_keywords(name=k)
+            formatted_key = formatter.encode(property_name=new_key) if formatter else new_key
+            nested_key = prop_info.xml_array_config[1] if prop_info.is_array and prop_info.xml_array_config else None
+            entries.append((
+                k, new_key,
+                _namespace_element_name(new_key, xmlns),
+                _namespace_element_name(formatted_key, xmlns),
+                _namespace_element_name(nested_key, xmlns) if nested_key is not None else None,
+                prop_info, _xml_emitter(prop_info)
+            ))
+        plan = _XML_PLANS[(klass, formatter, xmlns, view_)] = tuple(entries)
+    return plan
+
+
+def _json_custom_names(klass: type) -> Dict[str, str]:
+    """Reverse map of custom JSON names -> property names."""
+    names = _JSON_CUSTOM_NAMES.get(klass)
+    if names is None:
+        names = _JSON_CUSTOM_NAMES[klass] = {
+            prop_info.json_custom_name: k
+            for k, prop_info in ObjectMetadataLibrary.klass_property_mappings.get(
+                _klass_qualified_name(klass), {}).items()
+            if prop_info.json_custom_name is not None
+        }
+    return names
+
+
+def _xml_custom_names(klass: type) -> Dict[str, str]:
+    """Reverse map of custom XML names -> property names."""
+    names = _XML_CUSTOM_NAMES.get(klass)
+    if names is None:
+        names = _XML_CUSTOM_NAMES[klass] = {
+            prop_info.xml_custom_name: k
+            for k, prop_info in ObjectMetadataLibrary.klass_property_mappings.get(
+                _klass_qualified_name(klass), {}).items()
+            if prop_info.xml_custom_name is not None
+        }
+    return names
+
+
+def _json_keys(klass: type) -> Dict[str, Optional[str]]:
+    """Memo for JSON keys, filled as `_json_key()` resolves them."""
+    formatter = CurrentFormatter.formatter
+    keys = _JSON_KEYS.get((klass, formatter))
+    if keys is None:
+        keys = _JSON_KEYS[(klass, formatter)] = {}
+    return keys
+
+
+def _json_key(klass: type, klass_metadata: 'ObjectMetadataLibrary.SerializableClass',
+              klass_properties: Dict[str, 'ObjectMetadataLibrary.SerializableProperty'], k: str) -> Optional[str]:
+    """The property name for JSON key `k`, or `None` if `k` is to be ignored."""
+    decoded_k = CurrentFormatter.formatter.decode(property_name=k)
+    if decoded_k in klass_metadata.ignore_during_deserialization:
+        return None
+
+    if decoded_k in klass_properties:
+        return decoded_k
+
+    json_custom_names = _json_custom_names(klass)
+    new_key = json_custom_names.get(k) or json_custom_names.get(decoded_k)
+    if new_key is None:
+        _logger.error('Unexpected key %s/%s in data being serialized to %s',
+                      k, decoded_k, _klass_qualified_name(klass))
+        raise ValueError(
+            f'Unexpected key {k}/{decoded_k} in data being serialized to {_klass_qualified_name(klass)}'
+        )
+    return new_key
+
+
+def _xml_readers(klass: type) -> Dict[str, _XmlReader]:
+    readers = _XML_READERS.get(klass)
+    if readers is None:
+        readers = _XML_READERS[klass] = {
+            k: _xml_reader(prop_info)
+            for k, prop_info in ObjectMetadataLibrary.klass_property_mappings.get(
+                _klass_qualified_name(klass), {}).items()
+        }
+    return readers
+
+
+def _xml_child_keys(klass: type) -> Dict[str, Tuple[str, bool]]:
+    """Memo for child element tags (default namespace stripped), filled as `_xml_child_key()` resolves them.
+
+    Only tags that resolve to a Property, or that are ignored or skipped, are remembered - the memo is bounded by the
+    class' metadata, not by what documents contain.
+    """
+    formatter = CurrentFormatter.formatter
+    keys = _XML_CHILD_KEYS.get((klass, formatter))
+    if keys is None:
+        keys = _XML_CHILD_KEYS[(klass, formatter)] = {}
+    return keys
+
+
+def _xml_child_key(klass_metadata: 'ObjectMetadataLibrary.SerializableClass',
+                   klass_properties: Dict[str, 'ObjectMetadataLibrary.SerializableProperty'],
+                   tag: str) -> Tuple[str, bool]:
+    """The property name for a child element's tag (default namespace stripped), and whether it is to be ignored.
+
+    The property name is `_XML_CHILD_SKIP` for items of nested arrays.
+    """
+    decoded_k = CurrentFormatter.formatter.decode(tag)
+
+    if decoded_k not in klass_properties:
+        for p, pi in klass_properties.items():
+            if pi.xml_array_config:
+                array_type, nested_name = pi.xml_array_config
+                if nested_name == tag:
+                    decoded_k = p
+
+    if decoded_k in klass_metadata.ignore_during_deserialization:
+        return decoded_k, True
+
+    if decoded_k not in klass_properties:
+        for p, pi in klass_properties.items():
+            if pi.xml_array_config:
+                array_type, nested_name = pi.xml_array_config
+                if nested_name == decoded_k:
+                    if array_type == XmlArraySerializationType.FLAT:
+                        decoded_k = p
+                    else:
+                        decoded_k = _XML_CHILD_SKIP
+            elif pi.xml_custom_name == decoded_k:
+                decoded_k = p
+
+    return decoded_k, False
+
+
+def _xml_attribute_keys(klass: type, xmlns: Optional[str]) -> _XmlAttributeKeys:
+    """Memo for instance attribute names, filled as `_xml_attribute_key()` sees them."""
+    formatter = CurrentFormatter.formatter
+    keys = _XML_ATTRIBUTE_KEYS.get((klass, formatter, xmlns))
+    if keys is None:
+        keys = _XML_ATTRIBUTE_KEYS[(klass, formatter, xmlns)] = {}
+    return keys
+
+
+def _xml_attribute_key(klass: type, xmlns: Optional[str],
+                       k: str) -> Optional[Tuple[str, str, 'ObjectMetadataLibrary.SerializableProperty']]:
+    # Remove leading _ in key names
+    new_key = k[1:]
+    if new_key.startswith('_') or '__' in new_key:
+        return None
+    new_key = BaseNameFormatter.decode_handle_python_builtins_and_keywords(name=new_key)
+    prop_info = ObjectMetadataLibrary.klass_property_mappings.get(_klass_qualified_name(klass), {}).get(new_key)
+    if prop_info is None or not prop_info.is_xml_attribute:
+        return None
+    if prop_info.xml_custom_name is not None:
+        new_key = prop_info.xml_custom_name
+    if CurrentFormatter.formatter:
+        new_key = CurrentFormatter.formatter.encode(property_name=new_key)
+    return new_key, _namespace_element_name(new_key, xmlns), prop_info
+
+
+# endregion serialization plans
 
 
 class _SerializableJsonEncoder(JSONEncoder):
@@ -218,74 +751,51 @@ class _SerializableJsonEncoder(JSONEncoder):
         return self._view
 
     def default(self, o: Any) -> Any:
+        # exact type checks first - cheap compared to `isinstance()`, especially for the `EnumMeta` machinery
+        t = type(o)
+
         # Enum
-        if isinstance(o, Enum):
-            return o.value
+        if type(t) is EnumMeta or isinstance(o, Enum):
+            return _enum_value(o)
 
         # Iterables
-        if isinstance(o, (list, set)):
+        if t is list or t is set or isinstance(o, (list, set, frozenset)):
             return list(o)
 
-        # Classes
-        if isinstance(o, object):
-            d: Dict[Any, Any] = {}
-            klass_qualified_name = f'{o.__module__}.{o.__class__.__qualname__}'
-            serializable_property_info = ObjectMetadataLibrary.klass_property_mappings.get(klass_qualified_name, {})
+        # Classes - everything else is an object
+        d: Dict[Any, Any] = {}
+        view_ = self._view
 
-            # Handle remaining Properties that will be sub elements
-            for k, prop_info in serializable_property_info.items():
-                v = getattr(o, k)
+        # Handle remaining Properties that will be sub elements
+        for k, new_key, prop_info, convert in _json_plan(t, view_):
+            v = getattr(o, k)
 
-                if not _allow_property_for_view(prop_info=prop_info, view_=self._view, value_=v):
-                    # Skip as rendering for a view and this Property is not registered form this View
-                    continue
+            if not _allow_property_for_view(prop_info=prop_info, view_=view_, value_=v):
+                # Skip as rendering for a view and this Property is not registered form this View
+                continue
 
-                new_key = BaseNameFormatter.decode_handle_python_builtins_and_keywords(name=k)
+            if convert is not None:
+                v = convert(v, prop_info, view_, t)
 
-                if custom_name := prop_info.custom_names.get(SerializationType.JSON):
-                    new_key = str(custom_name)
+            if new_key == '.':
+                return v
 
-                if CurrentFormatter.formatter:
-                    new_key = CurrentFormatter.formatter.encode(property_name=new_key)
+            if _allow_property_for_view(prop_info=prop_info, view_=view_, value_=v):
+                # We need to recheck as values may have been modified above
+                d[new_key] = v if v is not None else prop_info.get_none_value_for_view(view_=view_)
 
-                if prop_info.custom_type:
-                    if prop_info.is_helper_type():
-                        v = prop_info.custom_type.json_normalize(
-                            v, view=self._view, prop_info=prop_info, ctx=o.__class__)
-                    else:
-                        v = prop_info.custom_type(v)
-                elif prop_info.is_array:
-                    if len(v) > 0:
-                        v = list(v)
-                    else:
-                        v = None
-                elif prop_info.is_enum:
-                    v = str(v.value)
-                elif not prop_info.is_primitive_type():
-                    if isinstance(v, Decimal):
-                        if prop_info.string_format:
-                            v = float(f'{v:{prop_info.string_format}}')
-                        else:
-                            v = float(v)
-                    else:
-                        global_klass_name = f'{prop_info.concrete_type.__module__}.{prop_info.concrete_type.__name__}'
-                        if global_klass_name not in ObjectMetadataLibrary.klass_mappings:
-                            if prop_info.string_format:
-                                v = f'{v:{prop_info.string_format}}'
-                            else:
-                                v = str(v)
+        return d
 
-                if new_key == '.':
-                    return v
 
-                if _allow_property_for_view(prop_info=prop_info, view_=self._view, value_=v):
-                    # We need to recheck as values may have been modified above
-                    d.update({new_key: v if v is not None else prop_info.get_none_value_for_view(view_=self._view)})
+# encoders keep no state between `encode()` calls - one per view can be shared
+_JSON_ENCODERS: Dict[Optional[Type[ViewType]], _SerializableJsonEncoder] = {}
 
-            return d
 
-        # Fallback to default
-        super().default(o=o)
+def _json_encoder(view_: Optional[Type[ViewType]]) -> _SerializableJsonEncoder:
+    encoder = _JSON_ENCODERS.get(view_)
+    if encoder is None:
+        encoder = _JSON_ENCODERS[view_] = _SerializableJsonEncoder(view_=view_)
+    return encoder
 
 
 class _JsonSerializable(Protocol):
@@ -296,7 +806,7 @@ class _JsonSerializable(Protocol):
         ``serializable``.
         """
         _logger.debug('Dumping %s to JSON with view: %s...', self, view_)
-        return json_dumps(self, cls=_SerializableJsonEncoder, view_=view_)
+        return _json_encoder(view_).encode(self)
 
     @classmethod
     def from_json(cls: Type[_T], data: Dict[str, Any]) -> Optional[_T]:
@@ -305,7 +815,7 @@ class _JsonSerializable(Protocol):
         ``serializable``.
         """
         _logger.debug('Rendering JSON to %s...', cls)
-        klass_qualified_name = f'{cls.__module__}.{cls.__qualname__}'
+        klass_qualified_name = _klass_qualified_name(cls)
         klass = ObjectMetadataLibrary.klass_mappings.get(klass_qualified_name)
         klass_properties = ObjectMetadataLibrary.klass_property_mappings.get(klass_qualified_name, {})
 
@@ -317,34 +827,19 @@ class _JsonSerializable(Protocol):
 
         if len(klass_properties) == 1:
             k, only_prop = next(iter(klass_properties.items()))
-            if only_prop.custom_names.get(SerializationType.JSON) == '.':
+            if only_prop.json_custom_name == '.':
                 return cls(**{only_prop.name: data})
 
-        _data = copy(data)
+        json_keys = _json_keys(cls)
+        _data: Dict[str, Any] = {}
         for k, v in data.items():
-            decoded_k = CurrentFormatter.formatter.decode(property_name=k)
-            if decoded_k in klass.ignore_during_deserialization:
+            try:
+                new_key = json_keys[k]
+            except KeyError:
+                new_key = json_keys[k] = _json_key(cls, klass, klass_properties, k)
+            if new_key is None:
                 _logger.debug('Ignoring %s when deserializing %s.%s', k, cls.__module__, cls.__qualname__)
-                del _data[k]
                 continue
-
-            new_key = None
-            if decoded_k not in klass_properties:
-                _allowed_custom_names = {decoded_k, k}
-                for p, pi in klass_properties.items():
-                    if pi.custom_names.get(SerializationType.JSON) in _allowed_custom_names:
-                        new_key = p
-            else:
-                new_key = decoded_k
-
-            if new_key is None:
-                _logger.error('Unexpected key %s/%s in data being serialized to %s.%s',
-                              k, decoded_k, cls.__module__, cls.__qualname__)
-                raise ValueError(
-                    f'Unexpected key {k}/{decoded_k} in data being serialized to {cls.__module__}.{cls.__qualname__}'
-                )
-
-            del (_data[k])
             _data[new_key] = v
 
         for k, v in _data.items():
@@ -370,8 +865,7 @@ class _JsonSerializable(Protocol):
                 elif prop_info.is_enum:
                     _data[k] = prop_info.concrete_type(v)
                 elif not prop_info.is_primitive_type():
-                    global_klass_name = f'{prop_info.concrete_type.__module__}.{prop_info.concrete_type.__name__}'
-                    if global_klass_name in ObjectMetadataLibrary.klass_mappings:
+                    if _is_registered_klass(prop_info.concrete_type):
                         _data[k] = prop_info.concrete_type.from_json(data=v)
                     else:
                         if prop_info.concrete_type is Decimal:
@@ -391,7 +885,7 @@ class _JsonSerializable(Protocol):
         return cls(**_data)
 
 
-_XML_BOOL_REPRESENTATIONS_TRUE = ('1', 'true')
+_XML_BOOL_REPRESENTATIONS_TRUE = frozenset(('1', 'true'))
 
 
 class _XmlSerializable(Protocol):
@@ -405,52 +899,44 @@ class _XmlSerializable(Protocol):
         """
         _logger.debug('Dumping %s to XML with view %s...', self, view_)
 
+        klass = self.__class__
         this_e_attributes = {}
-        klass_qualified_name = f'{self.__class__.__module__}.{self.__class__.__qualname__}'
-        serializable_property_info = {k: v for k, v in sorted(
-            ObjectMetadataLibrary.klass_property_mappings.get(klass_qualified_name, {}).items(),
-            key=lambda i: i[1].xml_sequence)}
+        attribute_keys = _xml_attribute_keys(klass, xmlns)
 
         for k, v in self.__dict__.items():
-            # Remove leading _ in key names
-            new_key = k[1:]
-            if new_key.startswith('_') or '__' in new_key:
-                continue
-            new_key = BaseNameFormatter.decode_handle_python_builtins_and_keywords(name=new_key)
-
-            if new_key in serializable_property_info:
-                prop_info = cast('ObjectMetadataLibrary.SerializableProperty', serializable_property_info.get(new_key))
+            try:
+                attribute_key = attribute_keys[k]
+            except KeyError:
+                attribute_key = attribute_keys[k] = _xml_attribute_key(klass, xmlns, k)
+            if attribute_key is not None:
+                new_key, namespaced_key, prop_info = attribute_key
 
                 if not _allow_property_for_view(prop_info=prop_info, view_=view_, value_=v):
                     # Skip as rendering for a view and this Property is not registered form this View
                     continue
 
-                if prop_info and prop_info.is_xml_attribute:
-                    new_key = prop_info.custom_names.get(SerializationType.XML, new_key)
-                    if CurrentFormatter.formatter:
-                        new_key = CurrentFormatter.formatter.encode(property_name=new_key)
-
-                    if prop_info.custom_type and prop_info.is_helper_type():
-                        v = prop_info.custom_type.xml_normalize(
-                            v, view=view_, element_name=new_key, xmlns=xmlns, prop_info=prop_info, ctx=self.__class__)
-                    elif prop_info.is_enum:
-                        v = v.value
+                if prop_info.custom_type and prop_info.is_helper_type():
+                    v = prop_info.custom_type.xml_normalize(
+                        v, view=view_, element_name=new_key, xmlns=xmlns, prop_info=prop_info, ctx=klass)
+                elif prop_info.is_enum:
+                    v = _enum_value(v)
 
-                    if v is None:
-                        v = prop_info.get_none_value_for_view(view_=view_)
-                    if v is None:
-                        continue
+                if v is None:
+                    v = prop_info.get_none_value_for_view(view_=view_)
+                if v is None:
+                    continue
 
-                    this_e_attributes[_namespace_element_name(new_key, xmlns)] = \
-                        _xs_string_mod_apply(str(v), prop_info.xml_string_config)
+                this_e_attributes[namespaced_key] = \
+                    _xs_string_mod_apply(str(v), prop_info.xml_string_config)
 
         element_name = _namespace_element_name(
-            element_name if element_name else CurrentFormatter.formatter.encode(self.__class__.__name__),
+            element_name if element_name else CurrentFormatter.formatter.encode(klass.__name__),
             xmlns)
         this_e = Element(element_name, this_e_attributes)
 
         # Handle remaining Properties that will be sub elements
-        for k, prop_info in serializable_property_info.items():
+        xml_plan = _xml_plan(klass, xmlns, view_)
+        for k, new_key, empty_key, formatted_key, nested_key, prop_info, emit in xml_plan:
             # Skip if rendering for a View and this Property is not designated for this View
             v = getattr(self, k)
 
@@ -458,92 +944,21 @@ class _XmlSerializable(Protocol):
                 # Skip as rendering for a view and this Property is not registered form this View
                 continue
 
-            new_key = BaseNameFormatter.decode_handle_python_builtins_and_keywords(name=k)
-
-            if not prop_info:
-                raise ValueError(f'{new_key} is not a known Property for {klass_qualified_name}')
-
-            if not prop_info.is_xml_attribute:
-                new_key = prop_info.custom_names.get(SerializationType.XML, new_key)
-
-                if v is None:
-                    v = prop_info.get_none_value_for_view(view_=view_)
-                if v is None:
-                    SubElement(this_e, _namespace_element_name(tag_name=new_key, xmlns=xmlns))
-                    continue
-
-                if new_key == '.':
-                    this_e.text = _xs_string_mod_apply(str(v),
-                                                       prop_info.xml_string_config)
-                    continue
+            if v is None:
+                v = prop_info.get_none_value_for_view(view_=view_)
+            if v is None:
+                SubElement(this_e, empty_key)
+                continue
 
-                if CurrentFormatter.formatter:
-                    new_key = CurrentFormatter.formatter.encode(property_name=new_key)
-                new_key = _namespace_element_name(new_key, xmlns)
+            if new_key == '.':
+                this_e.text = _xs_string_mod_apply(str(v),
+                                                   prop_info.xml_string_config)
+                continue
 
-                if prop_info.is_array and prop_info.xml_array_config:
-                    _array_type, nested_key = prop_info.xml_array_config
-                    nested_key = _namespace_element_name(nested_key, xmlns)
-                    if _array_type and _array_type == XmlArraySerializationType.NESTED:
-                        nested_e = SubElement(this_e, new_key)
-                    else:
-                        nested_e = this_e
-                    for j in v:
-                        if not prop_info.is_primitive_type() and not prop_info.is_enum:
-                            nested_e.append(
-                                j.as_xml(view_=view_, as_string=False, element_name=nested_key, xmlns=xmlns))
-                        elif prop_info.is_enum:
-                            SubElement(nested_e, nested_key).text = _xs_string_mod_apply(str(j.value),
-                                                                                         prop_info.xml_string_config)
-                        elif prop_info.concrete_type in (float, int):
-                            SubElement(nested_e, nested_key).text = str(j)
-                        elif prop_info.concrete_type is bool:
-                            SubElement(nested_e, nested_key).text = str(j).lower()
-                        else:
-                            # Assume type is str
-                            SubElement(nested_e, nested_key).text = _xs_string_mod_apply(str(j),
-                                                                                         prop_info.xml_string_config)
-                elif prop_info.custom_type:
-                    if prop_info.is_helper_type():
-                        v_ser = prop_info.custom_type.xml_normalize(
-                            v, view=view_, element_name=new_key, xmlns=xmlns, prop_info=prop_info, ctx=self.__class__)
-                        if v_ser is None:
-                            pass  # skip the element
-                        elif isinstance(v_ser, Element):
-                            this_e.append(v_ser)
-                        else:
-                            SubElement(this_e, new_key).text = _xs_string_mod_apply(str(v_ser),
-                                                                                    prop_info.xml_string_config)
-                    else:
-                        SubElement(this_e, new_key).text = _xs_string_mod_apply(str(prop_info.custom_type(v)),
-                                                                                prop_info.xml_string_config)
-                elif prop_info.is_enum:
-                    SubElement(this_e, new_key).text = _xs_string_mod_apply(str(v.value),
-                                                                            prop_info.xml_string_config)
-                elif not prop_info.is_primitive_type():
-                    global_klass_name = f'{prop_info.concrete_type.__module__}.{prop_info.concrete_type.__name__}'
-                    if global_klass_name in ObjectMetadataLibrary.klass_mappings:
-                        # Handle other Serializable Classes
-                        this_e.append(v.as_xml(view_=view_, as_string=False, element_name=new_key, xmlns=xmlns))
-                    else:
-                        # Handle properties that have a type that is not a Python Primitive (e.g. int, float, str)
-                        if prop_info.string_format:
-                            SubElement(this_e, new_key).text = _xs_string_mod_apply(f'{v:{prop_info.string_format}}',
-                                                                                    prop_info.xml_string_config)
-                        else:
-                            SubElement(this_e, new_key).text = _xs_string_mod_apply(str(v),
-                                                                                    prop_info.xml_string_config)
-                elif prop_info.concrete_type in (float, int):
-                    SubElement(this_e, new_key).text = str(v)
-                elif prop_info.concrete_type is bool:
-                    SubElement(this_e, new_key).text = str(v).lower()
-                else:
-                    # Assume type is str
-                    SubElement(this_e, new_key).text = _xs_string_mod_apply(str(v),
-                                                                            prop_info.xml_string_config)
+            emit(this_e, formatted_key, v, prop_info, nested_key, view_, xmlns, klass)
 
         if as_string:
-            return cast(Element, SafeElementTree.tostring(this_e, 'unicode'))
+            return xml_tostring(this_e, 'unicode')
         else:
             return this_e
 
@@ -555,29 +970,35 @@ class _XmlSerializable(Protocol):
         ``serializable``.
         """
         _logger.debug('Rendering XML from %s to %s...', type(data), cls)
-        klass = ObjectMetadataLibrary.klass_mappings.get(f'{cls.__module__}.{cls.__qualname__}')
+        klass_qualified_name = _klass_qualified_name(cls)
+        klass = ObjectMetadataLibrary.klass_mappings.get(klass_qualified_name)
         if klass is None:
-            _logger.warning('%s.%s is not a known serializable class', cls.__module__, cls.__qualname__,
+            _logger.warning('%s is not a known serializable class', klass_qualified_name,
                             stacklevel=2)
             return None
 
-        klass_properties = ObjectMetadataLibrary.klass_property_mappings.get(f'{cls.__module__}.{cls.__qualname__}', {})
+        klass_properties = ObjectMetadataLibrary.klass_property_mappings.get(klass_qualified_name, {})
 
         if isinstance(data, TextIOBase):
-            data = cast(Element, SafeElementTree.fromstring(data.read()))
+            # parse incrementally from the stream, instead of reading the whole document into a string first
+            data = cast(Element, SafeElementTree.parse(data).getroot())
 
         if default_namespace is None:
-            _namespaces = dict(node for _, node in
-                               SafeElementTree.iterparse(StringIO(SafeElementTree.tostring(data, 'unicode')),
-                                                         events=['start-ns']))
-            default_namespace = (re_compile(r'^\{(.*?)\}.').search(data.tag) or (None, _namespaces.get('')))[1]
+            # An element's tag carries its namespace as `{ns}local` - no need to re-serialize and re-parse the tree.
+            tag = data.tag
+            if tag.startswith('{'):
+                ns_end = tag.find('}', 1)
+                if 0 < ns_end < len(tag) - 1:
+                    default_namespace = tag[1:ns_end]
 
         if default_namespace is None:
             def strip_default_namespace(s: str) -> str:
                 return s
         else:
+            default_namespace_prefix = f'{{{default_namespace}}}'
+
             def strip_default_namespace(s: str) -> str:
-                return s.replace(f'{{{default_namespace}}}', '')
+                return s.replace(default_namespace_prefix, '')
 
         _data: Dict[str, Any] = {}
 
@@ -589,9 +1010,7 @@ class _XmlSerializable(Protocol):
                 continue
 
             if decoded_k not in klass_properties:
-                for p, pi in klass_properties.items():
-                    if pi.custom_names.get(SerializationType.XML) == decoded_k:
-                        decoded_k = p
+                decoded_k = _xml_custom_names(cls).get(decoded_k, decoded_k)
 
             prop_info = klass_properties.get(decoded_k)
             if not prop_info:
@@ -613,37 +1032,27 @@ class _XmlSerializable(Protocol):
         # Handle Node text content
         if data.text:
             for p, pi in klass_properties.items():
-                if pi.custom_names.get(SerializationType.XML) == '.':
+                if pi.xml_custom_name == '.':
                     _data[p] = _xs_string_mod_apply(data.text.strip(), pi.xml_string_config)
 
         # Handle Sub-Elements
-        for child_e in data:
-            decoded_k = CurrentFormatter.formatter.decode(strip_default_namespace(child_e.tag))
-
-            if decoded_k not in klass_properties:
-                for p, pi in klass_properties.items():
-                    if pi.xml_array_config:
-                        array_type, nested_name = pi.xml_array_config
-                        if nested_name == strip_default_namespace(child_e.tag):
-                            decoded_k = p
+        child_keys = _xml_child_keys(cls)
+        readers = _xml_readers(cls)
+        # repeated (array) elements come in runs of the same tag - resolve the Property once per run
+        for tag, run in groupby(data, key=_element_tag):
+            tag = strip_default_namespace(tag)
+            try:
+                decoded_k, ignored = child_keys[tag]
+            except KeyError:
+                decoded_k, ignored = _xml_child_key(klass, klass_properties, tag)
+                if ignored or decoded_k == _XML_CHILD_SKIP or decoded_k in klass_properties:
+                    child_keys[tag] = (decoded_k, ignored)
 
-            if decoded_k in klass.ignore_during_deserialization:
+            if ignored:
                 _logger.debug('Ignoring %s when deserializing %s.%s', decoded_k, cls.__module__, cls.__qualname__)
                 continue
 
-            if decoded_k not in klass_properties:
-                for p, pi in klass_properties.items():
-                    if pi.xml_array_config:
-                        array_type, nested_name = pi.xml_array_config
-                        if nested_name == decoded_k:
-                            if array_type == XmlArraySerializationType.FLAT:
-                                decoded_k = p
-                            else:
-                                decoded_k = '____SKIP_ME____'
-                    elif pi.custom_names.get(SerializationType.XML) == decoded_k:
-                        decoded_k = p
-
-            if decoded_k == '____SKIP_ME____':
+            if decoded_k == _XML_CHILD_SKIP:
                 continue
 
             prop_info = klass_properties.get(decoded_k)
@@ -653,60 +1062,12 @@ class _XmlSerializable(Protocol):
             try:
                 _logger.debug('Handling %s', prop_info)
 
-                if child_e.text:
-                    child_e.text = _xs_string_mod_apply(child_e.text, prop_info.xml_string_config)
-
-                if prop_info.is_array and prop_info.xml_array_config:
-                    array_type, nested_name = prop_info.xml_array_config
-
-                    if decoded_k not in _data:
-                        _data[decoded_k] = []
-
-                    if array_type == XmlArraySerializationType.NESTED:
-                        for sub_child_e in child_e:
-                            if sub_child_e.text:
-                                sub_child_e.text = _xs_string_mod_apply(sub_child_e.text,
-                                                                        prop_info.xml_string_config)
-                            if not prop_info.is_primitive_type() and not prop_info.is_enum:
-                                _data[decoded_k].append(prop_info.concrete_type.from_xml(
-                                    data=sub_child_e, default_namespace=default_namespace)
-                                )
-                            else:
-                                _data[decoded_k].append(prop_info.concrete_type(sub_child_e.text))
-                    else:
-                        if not prop_info.is_primitive_type() and not prop_info.is_enum:
-                            _data[decoded_k].append(prop_info.concrete_type.from_xml(
-                                data=child_e, default_namespace=default_namespace)
-                            )
-                        elif prop_info.custom_type:
-                            if prop_info.is_helper_type():
-                                _data[decoded_k] = prop_info.custom_type.xml_denormalize(
-                                    child_e, default_ns=default_namespace, prop_info=prop_info, ctx=klass)
-                            else:
-                                _data[decoded_k] = prop_info.custom_type(child_e.text)
-                        else:
-                            _data[decoded_k].append(prop_info.concrete_type(child_e.text))
-                elif prop_info.custom_type:
-                    if prop_info.is_helper_type():
-                        _data[decoded_k] = prop_info.custom_type.xml_denormalize(
-                            child_e, default_ns=default_namespace, prop_info=prop_info, ctx=klass)
-                    else:
-                        _data[decoded_k] = prop_info.custom_type(child_e.text)
-                elif prop_info.is_enum:
-                    _data[decoded_k] = prop_info.concrete_type(child_e.text)
-                elif not prop_info.is_primitive_type():
-                    global_klass_name = f'{prop_info.concrete_type.__module__}.{prop_info.concrete_type.__name__}'
-                    if global_klass_name in ObjectMetadataLibrary.klass_mappings:
-                        _data[decoded_k] = prop_info.concrete_type.from_xml(
-                            data=child_e, default_namespace=default_namespace
-                        )
-                    else:
-                        _data[decoded_k] = prop_info.concrete_type(child_e.text)
-                else:
-                    if prop_info.concrete_type == bool:
-                        _data[decoded_k] = str(child_e.text) in _XML_BOOL_REPRESENTATIONS_TRUE
-                    else:
-                        _data[decoded_k] = prop_info.concrete_type(child_e.text)
+                read = readers[decoded_k]
+                xml_string_config = prop_info.xml_string_config
+                for child_e in run:
+                    if child_e.text:
+                        child_e.text = _xs_string_mod_apply(child_e.text, xml_string_config)
+                    read(_data, decoded_k, child_e, prop_info, default_namespace, klass)
             except AttributeError as e:
                 _logger.exception('There was an AttributeError deserializing JSON to %s.\n'
                                   'The Property is: %s\n'
@@ -731,6 +1092,15 @@ def _namespace_element_name(tag_name: str, xmlns: Optional[str]) -> str:
     return tag_name
 
 
+def _klass_properties(klass: type) -> List[Tuple[str, property]]:
+    """The properties of a class, including inherited ones - sorted by name, like `inspect.getmembers()` would."""
+    members: Dict[str, Any] = {}
+    for base in klass.__mro__:
+        for name, o in vars(base).items():
+            members.setdefault(name, o)
+    return sorted((name, o) for name, o in members.items() if ObjectMetadataLibrary.is_property(o))
+
+
 class ObjectMetadataLibrary:
     """namespace-like
 
@@ -738,16 +1108,19 @@ class ObjectMetadataLibrary:
     serialization and deserialization.
     """
     _deferred_property_type_parsing: Dict[str, Set['ObjectMetadataLibrary.SerializableProperty']] = {}
+    _parsed_type_strings: Dict[str, Tuple[Any, Any, bool, bool]] = {}
     _klass_views: Dict[str, Type[ViewType]] = {}
     _klass_property_array_config: Dict[str, Tuple[XmlArraySerializationType, str]] = {}
     _klass_property_string_config: Dict[str, Optional[XmlStringSerializationType]] = {}
-    _klass_property_attributes: Set[str] = set()
+    _klass_property_attributes: Dict[str, Set[str]] = {}
     _klass_property_include_none: Dict[str, Set[Tuple[Type[ViewType], Any]]] = {}
     _klass_property_names: Dict[str, Dict[SerializationType, str]] = {}
     _klass_property_string_formats: Dict[str, str] = {}
     _klass_property_types: Dict[str, type] = {}
     _klass_property_views: Dict[str, Set[Type[ViewType]]] = {}
     _klass_property_xml_sequence: Dict[str, int] = {}
+    _klass_simple_names: Dict[str, type] = {}
+    _enum_simple_names: Dict[str, Type[Enum]] = {}
     custom_enum_klasses: Set[Type[Enum]] = set()
     klass_mappings: Dict[str, 'ObjectMetadataLibrary.SerializableClass'] = {}
     klass_property_mappings: Dict[str, Dict[str, 'ObjectMetadataLibrary.SerializableProperty']] = {}
@@ -758,6 +1131,8 @@ class ObjectMetadataLibrary:
         (de-)serialization.
         """
 
+        __slots__ = ('_name', '_klass', '_custom_name', '_serialization_types', '_ignore_during_deserialization')
+
         def __init__(self, *, klass: type, custom_name: Optional[str] = None,
                      serialization_types: Optional[Iterable[SerializationType]] = None,
                      ignore_during_deserialization: Optional[Iterable[str]] = None) -> None:
@@ -798,9 +1173,22 @@ class ObjectMetadataLibrary:
         (de-)serialization.
         """
 
+        __slots__ = (
+            '_name', '_custom_names', '_json_custom_name', '_xml_custom_name', '_type_', '_concrete_type',
+            '_is_array', '_is_enum', '_is_optional', '_custom_type', '_include_none', '_include_none_views',
+            '_include_none_by_view', '_is_xml_attribute', '_string_format', '_views', '_xml_array_config',
+            '_xml_string_config', '_xml_sequence', '_view_flags', '_hash', '_deferred_type_parsing',
+            '_is_helper_type', '_is_primitive_type',
+        )
+
         _ARRAY_TYPES = {'List': List, 'Set': Set, 'SortedSet': Set}
         _SORTED_CONTAINERS_TYPES = {'SortedList': List, 'SortedSet': Set}
         _PRIMITIVE_TYPES = (bool, int, float, str)
+        _SPECIAL_TYPES: Dict[str, type] = {'Decimal': Decimal}
+
+        _OPTIONAL_PREFIXES = ('typing.Optional[', 'Optional[')
+        _FORWARD_REF_PATTERN = re_compile(r"ForwardRef\('([^']*)'\)")
+        _ARRAY_TYPE_PATTERN = re_compile(r"^(?P<array_type>[\w.]+)\[['\"]?(?P<array_of>\w+)['\"]?]$")
 
         _DEFAULT_XML_SEQUENCE = 100
 
@@ -816,18 +1204,25 @@ class ObjectMetadataLibrary:
 
             self._name = prop_name
             self._custom_names = custom_names
+            self._json_custom_name = custom_names.get(SerializationType.JSON)
+            self._xml_custom_name = custom_names.get(SerializationType.XML)
             self._type_ = None
             self._concrete_type = None
             self._is_array = False
             self._is_enum = False
             self._is_optional = False
             self._custom_type = custom_type
+            self._is_helper_type = isclass(custom_type) and issubclass(custom_type, BaseHelper)
+            self._is_primitive_type = False
             if include_none_config is not None:
                 self._include_none = True
                 self._include_none_views = include_none_config
             else:
                 self._include_none = False
                 self._include_none_views = set()
+            self._include_none_by_view: Dict[Type[ViewType], Any] = {}
+            for _v, _a in self._include_none_views:
+                self._include_none_by_view.setdefault(_v, _a)
             self._is_xml_attribute = is_xml_attribute
             self._string_format = string_format_
             self._views = set(views or ())
@@ -835,6 +1230,9 @@ class ObjectMetadataLibrary:
             self._xml_string_config = xml_string_config
             self._xml_sequence = xml_sequence_ or self._DEFAULT_XML_SEQUENCE
 
+            self._view_flags: Dict[Optional[Type[ViewType]], Tuple[bool, bool]] = {}
+            self._hash: Optional[int] = None
+
             self._deferred_type_parsing = False
             self._parse_type(type_=prop_type)
 
@@ -849,6 +1247,14 @@ class ObjectMetadataLibrary:
         def custom_name(self, serialization_type: SerializationType) -> Optional[str]:
             return self.custom_names.get(serialization_type)
 
+        @property
+        def json_custom_name(self) -> Optional[str]:
+            return self._json_custom_name
+
+        @property
+        def xml_custom_name(self) -> Optional[str]:
+            return self._xml_custom_name
+
         @property
         def type_(self) -> Any:
             return self._type_
@@ -870,17 +1276,43 @@ class ObjectMetadataLibrary:
             return self._include_none_views
 
         def include_none_for_view(self, view_: Type[ViewType]) -> bool:
-            for _v, _a in self._include_none_views:
-                if _v == view_:
-                    return True
+            return view_ in self._include_none_by_view
 
-            return False
+        def _add_include_none_view(self, view_: Type[ViewType], none_value: Any) -> None:
+            """Keep the per-View lookup in step with a late ``register_property_include_none()``."""
+            self._include_none_by_view.setdefault(view_, none_value)
+            self._view_flags.clear()
+
+        def view_flags(self, view_: Optional[Type[ViewType]]) -> Tuple[bool, bool]:
+            """Whether this Property is rendered for the given View: (for any value, for None or empty values).
+
+            Views and include-None config do not change, so this is memoized per View.
+            """
+            try:
+                return self._view_flags[view_]
+            except KeyError:
+                pass
+
+            # First check Property is part of the View is given
+            if self._views:
+                allow_for_view = bool(view_) and view_ in self._views
+            else:
+                allow_for_view = True
+
+            # Second check for inclusion of None values
+            if not self._include_none:
+                allow_none_for_view = False
+            elif self._include_none_views:
+                allow_none_for_view = view_ in self._include_none_by_view
+            else:
+                allow_none_for_view = allow_for_view
+
+            flags = self._view_flags[view_] = (allow_for_view, allow_none_for_view)
+            return flags
 
         def get_none_value_for_view(self, view_: Optional[Type[ViewType]]) -> Any:
             if view_:
-                for _v, _a in self._include_none_views:
-                    if _v == view_:
-                        return _a
+                return self._include_none_by_view.get(view_)
             return None
 
         @property
@@ -924,114 +1356,50 @@ class ObjectMetadataLibrary:
                 raise ValueError('No None Value for property that is not include_none')
 
         def is_helper_type(self) -> bool:
-            ct = self.custom_type
-            return isclass(ct) and issubclass(ct, BaseHelper)
+            return self._is_helper_type
 
         def is_primitive_type(self) -> bool:
-            return self.concrete_type in self._PRIMITIVE_TYPES
+            return self._is_primitive_type
 
         def parse_type_deferred(self) -> None:
             self._parse_type(type_=self._type_)
 
         def _parse_type(self, type_: Any) -> None:
+            self._hash = None
             self._type_ = type_ = self._handle_forward_ref(t_=type_)
 
             if type(type_) is str:
-                type_to_parse = str(type_)
-                # Handle types that are quoted strings e.g. 'SortedSet[MyObject]' or 'Optional[SortedSet[MyObject]]'
-                if type_to_parse.startswith('typing.Optional['):
-                    self._is_optional = True
-                    type_to_parse = type_to_parse[16:-1]
-                elif type_to_parse.startswith('Optional['):
-                    self._is_optional = True
-                    type_to_parse = type_to_parse[9:-1]
-
-                match = re_search(r"^(?P<array_type>[\w.]+)\[['\"]?(?P<array_of>\w+)['\"]?]$", type_to_parse)
-                if match:
-                    results = match.groupdict()
-                    if results.get('array_type') in self._SORTED_CONTAINERS_TYPES:
-                        mapped_array_type = self._SORTED_CONTAINERS_TYPES.get(str(results.get('array_type')))
-                        self._is_array = True
-                        try:
-                            # Will load any class already loaded assuming fully qualified name
-                            self._type_ = eval(f'{mapped_array_type}[{results.get("array_of")}]')
-                            self._concrete_type = eval(str(results.get('array_of')))
-                        except NameError:
-                            # Likely a class that is missing its fully qualified name
-                            _k: Optional[Any] = None
-                            for _k_name, _oml_sc in ObjectMetadataLibrary.klass_mappings.items():
-                                if _oml_sc.name == results.get('array_of'):
-                                    _k = _oml_sc.klass
-
-                            if _k is None:
-                                # Perhaps a custom ENUM?
-                                for _enum_klass in ObjectMetadataLibrary.custom_enum_klasses:
-                                    if _enum_klass.__name__ == results.get('array_of'):
-                                        _k = _enum_klass
-
-                            if _k is None:
-                                self._type_ = type_  # type: ignore
-                                self._deferred_type_parsing = True
-                                ObjectMetadataLibrary.defer_property_type_parsing(
-                                    prop=self, klasses=[str(results.get('array_of'))]
-                                )
-                                return
-
-                            self._type_ = mapped_array_type[_k]  # type: ignore
-                            self._concrete_type = _k  # type: ignore
-
-                    elif results.get('array_type', '').replace('typing.', '') in self._ARRAY_TYPES:
-                        mapped_array_type = self._ARRAY_TYPES.get(
-                            str(results.get('array_type', '').replace('typing.', ''))
-                        )
-                        self._is_array = True
-                        try:
-                            # Will load any class already loaded assuming fully qualified name
-                            self._type_ = eval(f'{mapped_array_type}[{results.get("array_of")}]')
-                            self._concrete_type = eval(str(results.get('array_of')))
-                        except NameError:
-                            # Likely a class that is missing its fully qualified name
-                            _l: Optional[Any] = None
-                            for _k_name, _oml_sc in ObjectMetadataLibrary.klass_mappings.items():
-                                if _oml_sc.name == results.get('array_of'):
-                                    _l = _oml_sc.klass
-
-                            if _l is None:
-                                # Perhaps a custom ENUM?
-                                for _enum_klass in ObjectMetadataLibrary.custom_enum_klasses:
-                                    if _enum_klass.__name__ == results.get('array_of'):
-                                        _l = _enum_klass
-
-                            if _l is None:
-                                self._type_ = type_  # type: ignore
-                                self._deferred_type_parsing = True
-                                ObjectMetadataLibrary.defer_property_type_parsing(
-                                    prop=self, klasses=[str(results.get('array_of'))]
-                                )
-                                return
-
-                            self._type_ = mapped_array_type[_l]  # type: ignore
-                            self._concrete_type = _l  # type: ignore
+                parsed = ObjectMetadataLibrary._parsed_type_strings.get(type_)
+                if parsed is None:
+                    if not self._parse_type_str(type_=type_):
+                        # deferred until the class it refers to gets registered
+                        return
+                    ObjectMetadataLibrary._parsed_type_strings[type_] = (
+                        self._type_, self._concrete_type, self._is_optional, self._is_array)
                 else:
-                    raise ValueError(f'Unable to handle Property with declared type: {type_}')
+                    self._type_, self._concrete_type, self._is_optional, self._is_array = parsed
             else:
                 # Handle real types
-                if len(getattr(self.type_, '__args__', ())) > 1:
+                # Arrays are recognized by their `typing` alias, like `List[int]`.
+                # Builtin generics, like `list[int]`, have always been kept as scalars.
+                args: Tuple[Any, ...] = getattr(type_, '__args__', ())
+                if len(args) > 1:
                     # Is this an Optional Property
-                    self._is_optional = type(None) in self.type_.__args__
+                    self._is_optional = type(None) in args
 
-                if self.is_optional:
-                    t, n = self.type_.__args__
+                if self._is_optional:
+                    t, n = args
                     if getattr(t, '_name', None) in self._ARRAY_TYPES:
                         self._is_array = True
                         t, = t.__args__
                     self._concrete_type = t
+                elif getattr(type_, '_name', None) in self._ARRAY_TYPES:
+                    self._is_array = True
+                    self._concrete_type, = args
                 else:
-                    if getattr(self.type_, '_name', None) in self._ARRAY_TYPES:
-                        self._is_array = True
-                        self._concrete_type, = self.type_.__args__
-                    else:
-                        self._concrete_type = self.type_
+                    self._concrete_type = type_
+
+            self._is_primitive_type = self._concrete_type in self._PRIMITIVE_TYPES
 
             # Handle Enums
             if issubclass(type(self.concrete_type), EnumMeta):
@@ -1041,15 +1409,58 @@ class ObjectMetadataLibrary:
             if self._deferred_type_parsing:
                 self._deferred_type_parsing = False
 
+        def _parse_type_str(self, type_: str) -> bool:
+            """Parse a type that is given as string. Returns `False` if parsing had to be deferred."""
+            type_to_parse = str(type_)
+            # Handle types that are quoted strings e.g. 'SortedSet[MyObject]' or 'Optional[SortedSet[MyObject]]'
+            for optional_prefix in self._OPTIONAL_PREFIXES:
+                if type_to_parse.startswith(optional_prefix):
+                    self._is_optional = True
+                    type_to_parse = type_to_parse[len(optional_prefix):-1]
+                    break
+
+            match = self._ARRAY_TYPE_PATTERN.match(type_to_parse)
+            if not match:
+                raise ValueError(f'Unable to handle Property with declared type: {type_}')
+
+            array_type, array_of = match.group('array_type', 'array_of')
+            mapped_array_type = self._SORTED_CONTAINERS_TYPES.get(array_type) \
+                or self._ARRAY_TYPES.get(array_type.replace('typing.', ''))
+            if mapped_array_type is None:
+                return True
+
+            self._is_array = True
+            # Builtins, like `str` - otherwise likely a class that is missing its fully qualified name
+            _k: Optional[Any] = getattr(builtins, array_of, None)
+            if _k is None:
+                # Non-builtin types that (de-)serialization handles itself, like `Decimal`
+                _k = self._SPECIAL_TYPES.get(array_of)
+            if _k is None:
+                _k = ObjectMetadataLibrary._klass_simple_names.get(array_of)
+            if _k is None:
+                # Perhaps a custom ENUM?
+                _k = ObjectMetadataLibrary._enum_simple_names.get(array_of)
+
+            if _k is None:
+                self._type_ = type_  # type: ignore
+                self._deferred_type_parsing = True
+                ObjectMetadataLibrary.defer_property_type_parsing(prop=self, klasses=[array_of])
+                return False
+
+            self._type_ = mapped_array_type[_k]  # type: ignore
+            self._concrete_type = _k  # type: ignore
+            return True
+
         def _handle_forward_ref(self, t_: Any) -> Any:
-            if 'ForwardRef' in str(t_):
-                return str(t_).replace("ForwardRef('", '"').replace("')", '"')
+            t_str = t_ if type(t_) is str else str(t_)
+            if 'ForwardRef' in t_str:
+                return self._FORWARD_REF_PATTERN.sub(r'"\1"', t_str)
             else:
                 return t_
 
         def __eq__(self, other: Any) -> bool:
             if isinstance(other, ObjectMetadataLibrary.SerializableProperty):
-                return hash(other) == hash(self)
+                return self is other or (hash(other) == hash(self) and other._hash_fields() == self._hash_fields())
             return False
 
         def __lt__(self, other: Any) -> bool:
@@ -1057,12 +1468,18 @@ class ObjectMetadataLibrary:
                 return self.xml_sequence < other.xml_sequence
             return NotImplemented
 
-        def __hash__(self) -> int:
-            return hash((
+        def _hash_fields(self) -> Tuple[Any, ...]:
+            return (
                 self.concrete_type, tuple(self.custom_names), self.custom_type, self.is_array, self.is_enum,
                 self.is_optional, self.is_xml_attribute, self.name, self.type_,
                 tuple(self.xml_array_config) if self.xml_array_config else None, self.xml_sequence
-            ))
+            )
+
+        def __hash__(self) -> int:
+            # only (re-)parsing the type changes any of the hashed fields - see `_parse_type()`
+            if self._hash is None:
+                self._hash = hash(self._hash_fields())
+            return self._hash
 
         def __repr__(self) -> str:
             return f'<s.oml.SerializableProperty name={self.name}, custom_names={self.custom_names}, ' \
@@ -1091,6 +1508,9 @@ class ObjectMetadataLibrary:
     @classmethod
     def register_enum(cls, klass: Type[_E]) -> Type[_E]:
         cls.custom_enum_klasses.add(klass)
+        cls._enum_simple_names[klass.__name__] = klass
+        # type strings might resolve differently now
+        cls._parsed_type_strings.clear()
         return klass
 
     @classmethod
@@ -1101,25 +1521,26 @@ class ObjectMetadataLibrary:
         if cls.is_klass_serializable(klass=klass):
             return klass
 
-        cls.klass_mappings[f'{klass.__module__}.{klass.__qualname__}'] = ObjectMetadataLibrary.SerializableClass(
+        qualified_class_name = f'{klass.__module__}.{klass.__qualname__}'
+        cls.klass_mappings[qualified_class_name] = ObjectMetadataLibrary.SerializableClass(
             klass=klass, serialization_types=serialization_types,
             ignore_during_deserialization=ignore_during_deserialization
         )
+        cls._klass_simple_names[klass.__name__] = klass
 
-        qualified_class_name = f'{klass.__module__}.{klass.__qualname__}'
-        cls.klass_property_mappings[qualified_class_name] = {}
+        klass_properties = cls.klass_property_mappings[qualified_class_name] = {}
         _logger.debug('Registering Class %s with custom name %s', qualified_class_name, custom_name)
-        for name, o in getmembers(klass, ObjectMetadataLibrary.is_property):
+        xml_attribute_names = cls._klass_property_attributes.get(qualified_class_name, ())
+        for name, o in _klass_properties(klass):
             qualified_property_name = f'{qualified_class_name}.{name}'
-            prop_arg_specs = getfullargspec(o.fget)
 
-            cls.klass_property_mappings[qualified_class_name][name] = ObjectMetadataLibrary.SerializableProperty(
+            klass_properties[name] = ObjectMetadataLibrary.SerializableProperty(
                 prop_name=name,
                 custom_names=ObjectMetadataLibrary._klass_property_names.get(qualified_property_name, {}),
-                prop_type=prop_arg_specs.annotations.get('return'),
+                prop_type=getattr(o.fget, '__annotations__', {}).get('return'),
                 custom_type=ObjectMetadataLibrary._klass_property_types.get(qualified_property_name),
                 include_none_config=ObjectMetadataLibrary._klass_property_include_none.get(qualified_property_name),
-                is_xml_attribute=(qualified_property_name in ObjectMetadataLibrary._klass_property_attributes),
+                is_xml_attribute=(name in xml_attribute_names),
                 string_format_=ObjectMetadataLibrary._klass_property_string_formats.get(qualified_property_name),
                 views=ObjectMetadataLibrary._klass_property_views.get(qualified_property_name),
                 xml_array_config=ObjectMetadataLibrary._klass_property_array_config.get(qualified_property_name),
@@ -1137,10 +1558,24 @@ class ObjectMetadataLibrary:
             klass.as_xml = _XmlSerializable.as_xml  # type:ignore[attr-defined]
             klass.from_xml = classmethod(_XmlSerializable.from_xml.__func__)  # type:ignore[attr-defined]
 
-        # Handle any deferred Properties depending on this class
-        for _p in ObjectMetadataLibrary._deferred_property_type_parsing.get(klass.__qualname__, ()):
+        # type strings might resolve differently now
+        cls._parsed_type_strings.clear()
+
+        # Handle any deferred Properties depending on this class - they were filed under its simple name.
+        # Those that still cannot be resolved defer themselves again.
+        for _p in ObjectMetadataLibrary._deferred_property_type_parsing.pop(klass.__name__, ()):
             _p.parse_type_deferred()
 
+        # Serialization plans might have been built before this class was (re-)registered
+        _JSON_PLANS.clear()
+        _XML_PLANS.clear()
+        _XML_ATTRIBUTE_KEYS.clear()
+        _JSON_CUSTOM_NAMES.clear()
+        _XML_CUSTOM_NAMES.clear()
+        _JSON_KEYS.clear()
+        _XML_CHILD_KEYS.clear()
+        _XML_READERS.clear()
+
         return klass
 
     @classmethod
@@ -1175,8 +1610,15 @@ class ObjectMetadataLibrary:
         val = (view_ or ViewType, none_value)
         if prop is None:
             cls._klass_property_include_none[qual_name] = {val}
-        else:
-            prop.add(val)
+            return
+        prop.add(val)
+        # A registered Property shares this set - its per-View lookup and memos need to follow.
+        qualified_class_name, property_name = qual_name.rsplit('.', 1)
+        prop_info = cls.klass_property_mappings.get(qualified_class_name, {}).get(property_name)
+        if prop_info is not None and prop_info.include_none_views is prop:
+            prop_info._add_include_none_view(*val)
+            _JSON_PLANS.clear()
+            _XML_PLANS.clear()
 
     @classmethod
     def register_property_view(cls, qual_name: str, view_: Type[ViewType]) -> None:
@@ -1198,7 +1640,12 @@ class ObjectMetadataLibrary:
 
     @classmethod
     def register_xml_property_attribute(cls, qual_name: str) -> None:
-        cls._klass_property_attributes.add(qual_name)
+        qualified_class_name, property_name = qual_name.rsplit('.', 1)
+        prop = cls._klass_property_attributes.get(qualified_class_name)
+        if prop is None:
+            cls._klass_property_attributes[qualified_class_name] = {property_name}
+        else:
+            prop.add(property_name)
 
     @classmethod
     def register_xml_property_sequence(cls, qual_name: str, sequence: int) -> None:
@@ -1295,129 +1742,113 @@ def serializable_class(
     return decorate(cls)
 
 
+def _register_property(register: Callable[..., None], message: str, kwargs: Dict[str, Any], f: _F) -> _F:
+    # every decorator of a Property registers under the same name - keep a single copy of it
+    qual_name = intern(f'{f.__module__}.{f.__qualname__}')
+    _logger.debug(message, qual_name, *kwargs.values())
+    register(qual_name=qual_name, **kwargs)
+    return f
+
+
+def _property_decorator(register: Callable[..., None], message: str, **kwargs: Any) -> Callable[[_F], _F]:
+    """Builds a decorator that registers the decorated Property via `register(qual_name=..., **kwargs)`."""
+    return partial(_register_property, register, message, kwargs)  # type:ignore[return-value]
+
+
 def type_mapping(type_: type) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s with custom type: %s', f.__module__, f.__qualname__, type_)
-        ObjectMetadataLibrary.register_property_type_mapping(
-            qual_name=f'{f.__module__}.{f.__qualname__}', mapped_type=type_
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_property_type_mapping,
+        'Registering %s with custom type: %s',
+        mapped_type=type_
+    )
 
 
 def include_none(view_: Optional[Type[ViewType]] = None, none_value: Optional[Any] = None) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s to include None for view: %s', f.__module__, f.__qualname__, view_)
-        ObjectMetadataLibrary.register_property_include_none(
-            qual_name=f'{f.__module__}.{f.__qualname__}', view_=view_, none_value=none_value
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_property_include_none,
+        'Registering %s to include None for view: %s with value: %s',
+        view_=view_, none_value=none_value
+    )
 
 
 def json_name(name: str) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s with JSON name: %s', f.__module__, f.__qualname__, name)
-        ObjectMetadataLibrary.register_custom_json_property_name(
-            qual_name=f'{f.__module__}.{f.__qualname__}', json_property_name=name
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_custom_json_property_name,
+        'Registering %s with JSON name: %s',
+        json_property_name=name
+    )
 
 
 def string_format(format_: str) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s with String Format: %s', f.__module__, f.__qualname__, format_)
-        ObjectMetadataLibrary.register_custom_string_format(
-            qual_name=f'{f.__module__}.{f.__qualname__}', string_format=format_
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_custom_string_format,
+        'Registering %s with String Format: %s',
+        string_format=format_
+    )
 
 
 def view(view_: Type[ViewType]) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s with View: %s', f.__module__, f.__qualname__, view_)
-        ObjectMetadataLibrary.register_property_view(
-            qual_name=f'{f.__module__}.{f.__qualname__}', view_=view_
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_property_view,
+        'Registering %s with View: %s',
+        view_=view_
+    )
 
 
 def xml_attribute() -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s as XML attribute', f.__module__, f.__qualname__)
-        ObjectMetadataLibrary.register_xml_property_attribute(qual_name=f'{f.__module__}.{f.__qualname__}')
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_xml_property_attribute,
+        'Registering %s as XML attribute'
+    )
 
 
 def xml_array(array_type: XmlArraySerializationType, child_name: str) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s as XML Array: %s:%s', f.__module__, f.__qualname__, array_type, child_name)
-        ObjectMetadataLibrary.register_xml_property_array_config(
-            qual_name=f'{f.__module__}.{f.__qualname__}', array_type=array_type, child_name=child_name
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_xml_property_array_config,
+        'Registering %s as XML Array: %s:%s',
+        array_type=array_type, child_name=child_name
+    )
 
 
 def xml_string(string_type: XmlStringSerializationType) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s as XML StringType: %s', f.__module__, f.__qualname__, string_type)
-        ObjectMetadataLibrary.register_xml_property_string_config(
-            qual_name=f'{f.__module__}.{f.__qualname__}', string_type=string_type
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_xml_property_string_config,
+        'Registering %s as XML StringType: %s',
+        string_type=string_type
+    )
 
 
 def xml_name(name: str) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s with XML name: %s', f.__module__, f.__qualname__, name)
-        ObjectMetadataLibrary.register_custom_xml_property_name(
-            qual_name=f'{f.__module__}.{f.__qualname__}', xml_property_name=name
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_custom_xml_property_name,
+        'Registering %s with XML name: %s',
+        xml_property_name=name
+    )
 
 
 def xml_sequence(sequence: int) -> Callable[[_F], _F]:
     """Decorator"""
 
-    def decorate(f: _F) -> _F:
-        _logger.debug('Registering %s.%s with XML sequence: %s', f.__module__, f.__qualname__, sequence)
-        ObjectMetadataLibrary.register_xml_property_sequence(
-            qual_name=f'{f.__module__}.{f.__qualname__}', sequence=sequence
-        )
-        return f
-
-    return decorate
+    return _property_decorator(
+        ObjectMetadataLibrary.register_xml_property_sequence,
+        'Registering %s with XML sequence: %s',
+        sequence=sequence
+    )
@@ -18,9 +18,13 @@
 # Copyright (c) Paul Horton. All Rights Reserved.
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from re import compile as re_compile
 from typing import Type
 
+# names come from a limited set of properties and tags - the built-in formatters cache their results
+_NAME_CACHE_SIZE = 1024
+
 
 class BaseNameFormatter(ABC):
 
@@ -53,6 +57,7 @@ class CamelCasePropertyNameFormatter(BaseNameFormatter):
     _DECODE_PATTERN = re_compile(r'(?<!^)(?=[A-Z])')
 
     @classmethod
+    @lru_cache(maxsize=_NAME_CACHE_SIZE)
     def encode(cls, property_name: str) -> str:
         property_name = property_name[:1].lower() + property_name[1:]
         return cls.encode_handle_python_builtins_and_keywords(
@@ -60,6 +65,7 @@ class CamelCasePropertyNameFormatter(BaseNameFormatter):
         )
 
     @classmethod
+    @lru_cache(maxsize=_NAME_CACHE_SIZE)
     def decode(cls, property_name: str) -> str:
         return cls.decode_handle_python_builtins_and_keywords(
             CamelCasePropertyNameFormatter._DECODE_PATTERN.sub('_', property_name).lower()
@@ -70,12 +76,14 @@ class KebabCasePropertyNameFormatter(BaseNameFormatter):
     _ENCODE_PATTERN = re_compile(r'(_)')
 
     @classmethod
+    @lru_cache(maxsize=_NAME_CACHE_SIZE)
     def encode(cls, property_name: str) -> str:
         property_name = cls.encode_handle_python_builtins_and_keywords(name=property_name)
         property_name = property_name[:1].lower() + property_name[1:]
         return KebabCasePropertyNameFormatter._ENCODE_PATTERN.sub(lambda x: '-', property_name)
 
     @classmethod
+    @lru_cache(maxsize=_NAME_CACHE_SIZE)
     def decode(cls, property_name: str) -> str:
         return cls.decode_handle_python_builtins_and_keywords(property_name.replace('-', '_'))
 
@@ -84,6 +92,7 @@ class SnakeCasePropertyNameFormatter(BaseNameFormatter):
     _ENCODE_PATTERN = re_compile(r'(.)([A-Z][a-z]+)')
 
     @classmethod
+    @lru_cache(maxsize=_NAME_CACHE_SIZE)
     def encode(cls, property_name: str) -> str:
         property_name = property_name[:1].lower() + property_name[1:]
         return cls.encode_handle_python_builtins_and_keywords(
@@ -91,6 +100,7 @@ class SnakeCasePropertyNameFormatter(BaseNameFormatter):
         )
 
     @classmethod
+    @lru_cache(maxsize=_NAME_CACHE_SIZE)
     def decode(cls, property_name: str) -> str:
         return cls.decode_handle_python_builtins_and_keywords(property_name)
 
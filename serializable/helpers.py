@@ -17,10 +17,11 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) Paul Horton. All Rights Reserved.
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from logging import getLogger
 from re import compile as re_compile
-from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, NoReturn, Optional, Tuple, Type, TypeVar, Union
 
 if TYPE_CHECKING:  # pragma: no cover
     from xml.etree.ElementTree import Element
@@ -31,6 +32,82 @@ _T = TypeVar('_T')
 
 _logger = getLogger(__name__)
 
+# bound once, as these are called per (de)serialized value
+_date_fromisoformat = date.fromisoformat
+_datetime_fromisoformat = datetime.fromisoformat
+
+_DIGITS = frozenset('0123456789')
+_ONE_SECOND = timedelta(seconds=1)
+
+_MSG_DATE_TZ_DATA_LOSS = 'Potential data loss will occur: dates with timezones not supported in Python'
+
+# documents tend to repeat the very same timestamps - remember recent parse results.
+# the results are immutable, so sharing them is safe.
+_PARSE_CACHE_SIZE = 1024
+
+# shapes that :py:meth:`date.fromisoformat` and :py:meth:`datetime.fromisoformat` accept on all supported pythons
+_PATTERN_PLAIN_DATE = re_compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+_PATTERN_PLAIN_DATETIME = re_compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}:[0-9]{2}(?:[+-][0-9]{2}:[0-9]{2})?')
+
+
+# region fixup_microseconds
+# see https://github.com/madpah/serializable/pull/138
+
+def _fix_microseconds(v: str, zulu: bool = False) -> Tuple[str, bool]:
+    """
+    Fix for Python's violation of ISO8601 for :py:meth:`datetime.fromisoformat`.
+      1. Ensure either 0 or exactly 6 decimal places for seconds.
+         Background: py<3.11 supports either 6 or 0 digits for milliseconds when parsing.
+      2. Ensure correct rounding of microseconds on the 6th digit.
+      3. If `zulu` is set, replace the trailing ZULU time designator with 00:00 offset.
+         Done in the same go, so that the value is rebuilt only once.
+
+    :return: the fixed value, and whether rounding carried over into the seconds - in which case the parsed value
+        is one second short.
+    """
+    v_end = len(v) - 1 if zulu else len(v)
+    offset = '+00:00' if zulu else ''
+    start = v.find('.', 0, v_end)
+    end = start + 1
+    while 0 < end < v_end and v[end] in _DIGITS:
+        end += 1
+    digits = v[start + 1:end] if start >= 0 else ''
+    if not digits:
+        return (v[:v_end] + offset if zulu else v), False
+    if len(digits) == 6 and not zulu:
+        return v, False  # already as needed
+    carry = False
+    if len(digits) <= 6:
+        fraction = '.' + digits.ljust(6, '0')
+    else:
+        # round half up on the 7th digit - pure integer arithmetic, no float involved
+        micros = (int(digits[:7]) + 5) // 10
+        if micros < 1_000_000:
+            fraction = f'.{micros:06d}'
+        else:
+            # overflow into the seconds - which might overflow into minutes, and so on.
+            # leave that to date arithmetic.
+            fraction = '.000000'
+            carry = True
+    return ''.join((v[:start], fraction, v[end:v_end], offset)), carry
+
+
+# endregion fixup_microseconds
+
+
+def _as_str(o: Any) -> str:
+    if type(o) is str:
+        return o
+    if isinstance(o, (bytes, bytearray)):
+        # `str()` would render the repr, like "b'...'"
+        return o.decode('ascii')
+    return str(o)
+
+
+def _raise_unsupported_iso_format(kind: str, o: Any) -> NoReturn:
+    raise ValueError(f'{kind} string supplied ({o}) is not a supported ISO Format') from None
+
 
 class BaseHelper:
     """Base Helper.
@@ -41,6 +118,8 @@ class BaseHelper:
     it is more like a Protocol with some fallback implementations.
     """
 
+    __slots__ = ()
+
     # region general/fallback
 
     @classmethod
@@ -53,6 +132,11 @@ class BaseHelper:
         """general purpose deserializer"""
         raise NotImplementedError()
 
+    @classmethod
+    def deserialize_many(cls, values: Iterable[Any]) -> List[Any]:
+        """general purpose deserializer for a batch of values"""
+        return list(map(cls.deserialize, values))
+
     # endregion general/fallback
 
     # region json specific
@@ -126,24 +210,49 @@ class BaseHelper:
 
 
 class Iso8601Date(BaseHelper):
+    __slots__ = ()
+
     _PATTERN_DATE = '%Y-%m-%d'
 
     @classmethod
     def serialize(cls, o: Any) -> str:
         if isinstance(o, date):
-            return o.strftime(Iso8601Date._PATTERN_DATE)
+            # same as `strftime(_PATTERN_DATE)`, without interpreting the pattern.
+            # unbound call, so that `datetime` values are rendered as date only.
+            return date.isoformat(o)
 
         raise ValueError(f'Attempt to serialize a non-date: {o.__class__}')
 
     @classmethod
     def deserialize(cls, o: Any) -> date:
         try:
-            return date.fromisoformat(str(o))
+            return _date_fromisoformat(_as_str(o))
         except ValueError:
-            raise ValueError(f'Date string supplied ({o}) does not match either "{Iso8601Date._PATTERN_DATE}"')
+            _raise_unsupported_iso_format('Date', o)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_xsd_date(v: str) -> Tuple[date, bool]:
+    """:return: the date, and whether timezone information was dropped"""
+    if _PATTERN_PLAIN_DATE.fullmatch(v):
+        # fast path: a well-formed value needs no fixup at all.
+        return _date_fromisoformat(v), False
+    if v[:1] == '-':
+        # Remove any leading hyphen
+        v = v[1:]
+
+    has_tz = v[-1:] == 'Z'
+    if has_tz:
+        v = v[:-1]
+    plus_idx = v.find('+')
+    if plus_idx >= 0:
+        v = v[:plus_idx]
+        has_tz = True
+    return _date_fromisoformat(v), has_tz
 
 
 class XsdDate(BaseHelper):
+    __slots__ = ()
 
     @classmethod
     def serialize(cls, o: Any) -> str:
@@ -155,27 +264,33 @@ class XsdDate(BaseHelper):
     @classmethod
     def deserialize(cls, o: Any) -> date:
         try:
-            v = str(o)
-            if v.startswith('-'):
-                # Remove any leading hyphen
-                v = v[1:]
-
-            if v.endswith('Z'):
-                v = v[:-1]
-                _logger.warning(
-                    'Potential data loss will occur: dates with timezones not supported in Python',
-                    stacklevel=2)
-            if '+' in v:
-                v = v[:v.index('+')]
-                _logger.warning(
-                    'Potential data loss will occur: dates with timezones not supported in Python',
-                    stacklevel=2)
-            return date.fromisoformat(v)
+            d, has_tz = _parse_xsd_date(_as_str(o))
         except ValueError:
-            raise ValueError(f'Date string supplied ({o}) is not a supported ISO Format')
+            _raise_unsupported_iso_format('Date', o)
+        if has_tz:
+            _logger.warning(_MSG_DATE_TZ_DATA_LOSS, stacklevel=2)
+        return d
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_xsd_datetime(v: str) -> datetime:
+    if _PATTERN_PLAIN_DATETIME.fullmatch(v):
+        # fast path: a well-formed value needs no fixup at all.
+        # values with fractions are excluded, as py>=3.11 would truncate instead of round them.
+        return _datetime_fromisoformat(v)
+    if v[:1] == '-':
+        # Remove any leading hyphen
+        v = v[1:]
+    zulu = v[-1:] == 'Z'
+    if zulu or '.' in v:
+        v, carry = _fix_microseconds(v, zulu)
+        if carry:
+            return _datetime_fromisoformat(v) + _ONE_SECOND
+    return _datetime_fromisoformat(v)
 
 
 class XsdDateTime(BaseHelper):
+    __slots__ = ()
 
     @staticmethod
     def __fix_tz(dt: datetime) -> datetime:
@@ -183,6 +298,9 @@ class XsdDateTime(BaseHelper):
         Fix for Python's violation of ISO8601: :py:meth:`datetime.isoformat()` might omit the time offset when in doubt,
         but the ISO-8601 assumes local time zone.
         Anyway, the time offset is mandatory for this purpose.
+
+        The local offset is intentionally resolved per value and not cached:
+        it depends on the date itself (daylight saving time, historic changes of the zone).
         """
         return dt.astimezone() \
             if dt.tzinfo is None \
@@ -195,34 +313,9 @@ class XsdDateTime(BaseHelper):
 
         raise ValueError(f'Attempt to serialize a non-date: {o.__class__}')
 
-    # region fixup_microseconds
-    # see https://github.com/madpah/serializable/pull/138
-
-    __PATTERN_FRACTION = re_compile(r'\.\d+')
-
-    @classmethod
-    def __fix_microseconds(cls, v: str) -> str:
-        """
-        Fix for Python's violation of ISO8601 for :py:meth:`datetime.fromisoformat`.
-          1. Ensure either 0 or exactly 6 decimal places for seconds.
-             Background: py<3.11 supports either 6 or 0 digits for milliseconds when parsing.
-          2. Ensure correct rounding of microseconds on the 6th digit.
-        """
-        return cls.__PATTERN_FRACTION.sub(lambda m: f'{(float(m.group(0))):.6f}'[1:], v)
-
-    # endregion fixup_microseconds
-
     @classmethod
     def deserialize(cls, o: Any) -> datetime:
         try:
-            v = str(o)
-            if v.startswith('-'):
-                # Remove any leading hyphen
-                v = v[1:]
-            if v.endswith('Z'):
-                # Replace ZULU time with 00:00 offset
-                v = f'{v[:-1]}+00:00'
-            return datetime.fromisoformat(
-                cls.__fix_microseconds(v))
+            return _parse_xsd_datetime(_as_str(o))
         except ValueError:
-            raise ValueError(f'Date-Time string supplied ({o}) is not a supported ISO Format')
+            _raise_unsupported_iso_format('Date-Time', o)
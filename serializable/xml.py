@@ -27,8 +27,9 @@ from re import compile as re_compile
 
 # region normalizedString
 
-__NORMALIZED_STRING_FORBIDDEN_SEARCH = re_compile(r'\r\n|\t|\n|\r')
+__NORMALIZED_STRING_FORBIDDEN_CRLF = '\r\n'
 __NORMALIZED_STRING_FORBIDDEN_REPLACE = ' '
+__NORMALIZED_STRING_FORBIDDEN_TRANSLATION = str.maketrans('\t\n\r', __NORMALIZED_STRING_FORBIDDEN_REPLACE * 3)
 
 
 def xs_normalizedString(s: str) -> str:
@@ -45,9 +46,11 @@ def xs_normalizedString(s: str) -> str:
 
        -- the `XML schema spec <http://www.w3.org/TR/xmlschema-2/#normalizedString>`_
     """
-    return __NORMALIZED_STRING_FORBIDDEN_SEARCH.sub(
-        __NORMALIZED_STRING_FORBIDDEN_REPLACE,
-        s)
+    # CRLF counts as a single forbidden sequence, so it must be replaced before the single characters.
+    return s.replace(
+        __NORMALIZED_STRING_FORBIDDEN_CRLF,
+        __NORMALIZED_STRING_FORBIDDEN_REPLACE
+    ).translate(__NORMALIZED_STRING_FORBIDDEN_TRANSLATION)
 
 
 # endregion
@@ -18,10 +18,61 @@
 # Copyright (c) Paul Horton. All Rights Reserved.
 
 from datetime import date, datetime, timedelta, timezone
+from typing import Any
 from unittest import TestCase
+from unittest.mock import patch
 
 from serializable import logger
-from serializable.helpers import Iso8601Date, XsdDate, XsdDateTime
+from serializable.helpers import BaseHelper, Iso8601Date, XsdDate, XsdDateTime
+
+
+class TestBaseHelper(TestCase):
+
+    def test_fallbacks_use_general_implementation(self) -> None:
+        class Helper(BaseHelper):
+            @classmethod
+            def serialize(cls, o: Any) -> str:
+                return f'S {o}'
+
+            @classmethod
+            def deserialize(cls, o: Any) -> str:
+                return f'D {o}'
+
+        self.assertEqual(Helper.json_serialize(1), 'S 1')
+        self.assertEqual(Helper.xml_serialize(1), 'S 1')
+        self.assertEqual(Helper.json_deserialize(1), 'D 1')
+        self.assertEqual(Helper.xml_deserialize(1), 'D 1')
+
+    def test_fallbacks_follow_overrides_in_subclasses(self) -> None:
+        class Helper(BaseHelper):
+            @classmethod
+            def serialize(cls, o: Any) -> str:
+                return f'S {o}'
+
+            @classmethod
+            def json_serialize(cls, o: Any) -> str:
+                return f'J {o}'
+
+        class SubHelper(Helper):
+            @classmethod
+            def serialize(cls, o: Any) -> str:
+                return f'SS {o}'
+
+        self.assertEqual(Helper.json_serialize(1), 'J 1')
+        self.assertEqual(Helper.xml_serialize(1), 'S 1')
+        self.assertEqual(SubHelper.json_serialize(1), 'J 1')
+        self.assertEqual(SubHelper.xml_serialize(1), 'SS 1')
+
+    def test_fallbacks_follow_patched_general_implementation(self) -> None:
+        class Helper(BaseHelper):
+            @classmethod
+            def serialize(cls, o: Any) -> str:
+                return f'S {o}'
+
+        with patch.object(Helper, 'serialize', return_value='patched'):
+            self.assertEqual(Helper.json_serialize(1), 'patched')
+            self.assertEqual(Helper.xml_serialize(1), 'patched')
+        self.assertEqual(Helper.json_serialize(1), 'S 1')
 
 
 class TestIso8601Date(TestCase):
@@ -38,16 +89,32 @@ class TestIso8601Date(TestCase):
             '2022-08-03'
         )
 
+    def test_serialize_date_small_year(self) -> None:
+        self.assertEqual(
+            Iso8601Date.serialize(date(year=33, month=1, day=2)),
+            '0033-01-02'
+        )
+
     def test_deserialize_valid_date(self) -> None:
         self.assertEqual(
             Iso8601Date.deserialize('2022-08-03'),
             date(year=2022, month=8, day=3)
         )
 
+    def test_deserialize_valid_bytes(self) -> None:
+        self.assertEqual(
+            Iso8601Date.deserialize(b'2022-08-03'),
+            date(year=2022, month=8, day=3)
+        )
+
     def test_deserialize_valid(self) -> None:
         with self.assertRaises(ValueError):
             Iso8601Date.deserialize('2022-08-03zzz')
 
+    def test_deserialize_invalid_message(self) -> None:
+        with self.assertRaisesRegex(ValueError, r'^Date string supplied \(.+\) is not a supported ISO Format$'):
+            Iso8601Date.deserialize('2022-08-03zzz')
+
 
 class TestXsdDate(TestCase):
     """
@@ -93,12 +160,31 @@ class TestXsdDate(TestCase):
             'Potential data loss will occur: dates with timezones not supported in Python',
             logs.output)
 
+    def test_deserialize_repeated_value_warns_each_time(self) -> None:
+        with self.assertLogs(logger) as logs:
+            for _ in range(2):
+                self.assertEqual(
+                    XsdDate.deserialize('2001-10-27+02:00'),
+                    date(year=2001, month=10, day=27)
+                )
+        self.assertEqual(len(logs.output), 2)
+
     def test_deserialize_valid_5(self) -> None:
         self.assertEqual(
             XsdDate.deserialize('-2001-10-26'),
             date(year=2001, month=10, day=26)
         )
 
+    def test_deserialize_valid_bytes(self) -> None:
+        self.assertEqual(
+            XsdDate.deserialize(b'2001-10-26'),
+            date(year=2001, month=10, day=26)
+        )
+
+    def test_deserialize_invalid_bytes(self) -> None:
+        with self.assertRaises(ValueError):
+            XsdDate.deserialize('2001-10-26\u00e4'.encode())
+
     def test_serialize_1(self) -> None:
         self.assertEqual(
             XsdDate.serialize(date(year=2001, month=10, day=26)),
@@ -176,6 +262,38 @@ class TestXsdDateTime(TestCase):
             datetime(year=2024, month=9, day=23, hour=8, minute=6, second=9, microsecond=185597, tzinfo=None)
         )
 
+    def test_deserialize_valid_10(self) -> None:
+        """Test that microseconds are rounded half up on the 7th decimal place."""
+        self.assertEqual(
+            XsdDateTime.deserialize('2024-09-23T08:06:09.0000005Z'),
+            datetime(year=2024, month=9, day=23, hour=8, minute=6,
+                     second=9, microsecond=1, tzinfo=timezone.utc)
+        )
+
+    def test_deserialize_valid_bytes(self) -> None:
+        self.assertEqual(
+            XsdDateTime.deserialize(bytearray(b'2001-10-26T19:32:52.1Z')),
+            datetime(year=2001, month=10, day=26, hour=19, minute=32, second=52, microsecond=100000,
+                     tzinfo=timezone.utc)
+        )
+
+    def test_deserialize_rounding_carries_into_seconds(self) -> None:
+        self.assertEqual(
+            XsdDateTime.deserialize('2024-09-23T08:06:09.9999995Z'),
+            datetime(year=2024, month=9, day=23, hour=8, minute=6, second=10, tzinfo=timezone.utc)
+        )
+        self.assertEqual(
+            XsdDateTime.deserialize('2024-12-31T23:59:59.99999999'),
+            datetime(year=2025, month=1, day=1)
+        )
+
+    def test_deserialize_many(self) -> None:
+        self.assertListEqual(
+            XsdDateTime.deserialize_many(('2001-10-26T19:32:52Z', '2001-10-26T21:32:52.5')),
+            [datetime(year=2001, month=10, day=26, hour=19, minute=32, second=52, tzinfo=timezone.utc),
+             datetime(year=2001, month=10, day=26, hour=21, minute=32, second=52, microsecond=500000)]
+        )
+
     def test_serialize_1(self) -> None:
         serialized = XsdDateTime.serialize(
             # assume winter time
@@ -190,6 +308,12 @@ class TestXsdDateTime(TestCase):
         )
         self.assertRegex(serialized, r'2001-07-26T21:32:52.012679(?:Z|[+-]\d\d:\d\d)')
 
+    def test_serialize_naive_uses_local_offset_of_the_value(self) -> None:
+        winter = datetime(year=2001, month=2, day=26, hour=21, minute=32, second=52, tzinfo=None)
+        summer = datetime(year=2001, month=7, day=26, hour=21, minute=32, second=52, tzinfo=None)
+        self.assertEqual(XsdDateTime.serialize(winter), winter.astimezone().isoformat())
+        self.assertEqual(XsdDateTime.serialize(summer), summer.astimezone().isoformat())
+
     def test_serialize_3(self) -> None:
         serialized = XsdDateTime.serialize(
             datetime(
@@ -18,13 +18,16 @@
 # Copyright (c) Paul Horton. All Rights Reserved.
 import json
 import os
+from typing import Any, FrozenSet
 
+from serializable import serializable_class, type_mapping
 from serializable.formatters import (
     CamelCasePropertyNameFormatter,
     CurrentFormatter,
     KebabCasePropertyNameFormatter,
     SnakeCasePropertyNameFormatter,
 )
+from serializable.helpers import BaseHelper
 from tests.base import FIXTURES_DIRECTORY, BaseTestCase
 from tests.model import (
     Book,
@@ -145,3 +148,22 @@ class TestJson(BaseTestCase):
         CurrentFormatter.formatter = CamelCasePropertyNameFormatter
         with open(os.path.join(FIXTURES_DIRECTORY, 'the-phoenix-project-bookedition-none.json')) as expected_json:
             self.assertEqualJson(expected_json.read(), ThePhoenixProject_attr_serialized_none.as_json())
+
+    def test_serialize_frozenset_as_list(self) -> None:
+        class TagsHelper(BaseHelper):
+            @classmethod
+            def serialize(cls, o: Any) -> FrozenSet[str]:
+                return frozenset(o)
+
+        @serializable_class
+        class Tagged:
+            def __init__(self, tags: str) -> None:
+                self._tags = tags
+
+            @property
+            @type_mapping(TagsHelper)
+            def tags(self) -> str:
+                return self._tags
+
+        CurrentFormatter.formatter = CamelCasePropertyNameFormatter
+        self.assertEqual(json.loads(Tagged(tags='a').as_json()), {'tags': ['a']})
@@ -17,10 +17,11 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) Paul Horton. All Rights Reserved.
 
-from typing import Optional
+from typing import List, Optional
 from unittest import TestCase
 
-from serializable import ObjectMetadataLibrary
+from serializable import ObjectMetadataLibrary, include_none, serializable_class
+from tests.model import SchemaVersion2, SchemaVersion3
 
 
 class TestOmlSp(TestCase):
@@ -42,3 +43,56 @@ class TestOmlSp(TestCase):
         self.assertFalse(p.is_enum)
         self.assertTrue(p.is_optional)
         self.assertTrue(p.is_primitive_type())
+
+
+class TestOmlDeferredTypes(TestCase):
+
+    def test_deferred_type_of_nested_class_is_resolved(self) -> None:
+        class Outer:
+            @serializable_class
+            class User:
+                def __init__(self, inners: List['Outer.Inner']) -> None:
+                    self._inners = inners
+
+                @property
+                def inners(self) -> 'List[Inner]':  # noqa: F821 # refers to the simple name, on purpose
+                    return self._inners
+
+            @serializable_class
+            class Inner:
+                def __init__(self, name: str) -> None:
+                    self._name = name
+
+                @property
+                def name(self) -> str:
+                    return self._name
+
+        prop = ObjectMetadataLibrary.klass_property_mappings[
+            f'{Outer.User.__module__}.{Outer.User.__qualname__}']['inners']
+        self.assertTrue(prop.is_array)
+        self.assertIs(prop.concrete_type, Outer.Inner)
+
+
+class TestOmlIncludeNone(TestCase):
+
+    def test_late_include_none_registration_is_seen(self) -> None:
+        @serializable_class
+        class Thing:
+            def __init__(self, value: Optional[str] = None) -> None:
+                self._value = value
+
+            @property
+            @include_none(SchemaVersion2)
+            def value(self) -> Optional[str]:
+                return self._value
+
+        qual_name = f'{Thing.__module__}.{Thing.__qualname__}'
+        prop = ObjectMetadataLibrary.klass_property_mappings[qual_name]['value']
+        self.assertEqual(prop.view_flags(SchemaVersion3), (True, False))
+
+        ObjectMetadataLibrary.register_property_include_none(f'{qual_name}.value', SchemaVersion3, 'NV')
+        self.assertIn((SchemaVersion3, 'NV'), prop.include_none_views)
+        self.assertTrue(prop.include_none_for_view(SchemaVersion3))
+        self.assertEqual(prop.get_none_value_for_view(SchemaVersion3), 'NV')
+        self.assertEqual(prop.view_flags(SchemaVersion3), (True, True))
+        self.assertEqual(Thing().as_json(view_=SchemaVersion3), '{"value": "NV"}')  # type:ignore[attr-defined]
@@ -17,12 +17,14 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) Paul Horton. All Rights Reserved.
 import datetime
+import sys
+from decimal import Decimal
 from typing import List, Optional, Set
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
-from serializable import ObjectMetadataLibrary
+from serializable import ObjectMetadataLibrary, SerializationType
 from serializable.helpers import Iso8601Date
-from tests.model import BookEdition
+from tests.model import BookEdition, SchemaVersion1, SchemaVersion2, SchemaVersion3
 
 
 class TestOmlSerializableProperty(TestCase):
@@ -91,6 +93,20 @@ class TestOmlSerializableProperty(TestCase):
         self.assertTrue(sp.is_primitive_type())
         self.assertFalse(sp.is_helper_type())
 
+    @skipIf(sys.version_info < (3, 9), 'builtin generics require Python >= 3.9')
+    def test_builtin_generics_are_scalars(self) -> None:
+        sp = ObjectMetadataLibrary.SerializableProperty(
+            prop_name='name', prop_type=list[int], custom_names={}
+        )
+        self.assertFalse(sp.is_array)
+        self.assertEqual(sp.concrete_type, list[int])
+        sp = ObjectMetadataLibrary.SerializableProperty(
+            prop_name='name', prop_type=Optional[set[str]], custom_names={}
+        )
+        self.assertTrue(sp.is_optional)
+        self.assertFalse(sp.is_array)
+        self.assertEqual(sp.concrete_type, set[str])
+
     def test_sorted_set_1(self) -> None:
         sp = ObjectMetadataLibrary.SerializableProperty(
             prop_name='name', prop_type='SortedSet[BookEdition]', custom_names={}
@@ -123,6 +139,17 @@ class TestOmlSerializableProperty(TestCase):
         self.assertFalse(sp.is_primitive_type())
         self.assertFalse(sp.is_helper_type())
 
+    def test_decimal_list_from_string(self) -> None:
+        sp = ObjectMetadataLibrary.SerializableProperty(
+            prop_name='prices', prop_type='List[Decimal]', custom_names={}
+        )
+        self.assertEqual(sp.type_, List[Decimal])
+        self.assertIs(sp.concrete_type, Decimal)
+        self.assertTrue(sp.is_array)
+        self.assertFalse(sp.is_optional)
+        self.assertNotIn(sp, ObjectMetadataLibrary._deferred_property_type_parsing.get('Decimal', ()))
+        self.assertFalse(sp.is_primitive_type())
+
     def test_datetime_using_helper(self) -> None:
         sp = ObjectMetadataLibrary.SerializableProperty(
             prop_name='publish_date', prop_type=datetime.datetime, custom_names={}, custom_type=Iso8601Date
@@ -138,3 +165,38 @@ class TestOmlSerializableProperty(TestCase):
         self.assertFalse(sp.is_xml_attribute)
         self.assertFalse(sp.is_primitive_type())
         self.assertTrue(sp.is_helper_type())
+
+    def test_custom_names(self) -> None:
+        sp = ObjectMetadataLibrary.SerializableProperty(
+            prop_name='name', prop_type=str,
+            custom_names={SerializationType.JSON: 'jsonName', SerializationType.XML: 'xmlName'}
+        )
+        self.assertEqual(sp.json_custom_name, 'jsonName')
+        self.assertEqual(sp.xml_custom_name, 'xmlName')
+        self.assertEqual(sp.custom_name(SerializationType.JSON), 'jsonName')
+        self.assertEqual(sp.custom_name(SerializationType.XML), 'xmlName')
+
+    def test_view_flags(self) -> None:
+        sp = ObjectMetadataLibrary.SerializableProperty(
+            prop_name='name', prop_type=Optional[str], custom_names={},
+            include_none_config={(SchemaVersion3, 'RUBBISH')}, views=[SchemaVersion2, SchemaVersion3]
+        )
+        self.assertEqual(sp.view_flags(None), (False, False))
+        self.assertEqual(sp.view_flags(SchemaVersion1), (False, False))
+        self.assertEqual(sp.view_flags(SchemaVersion2), (True, False))
+        self.assertEqual(sp.view_flags(SchemaVersion3), (True, True))
+
+    def test_eq_and_hash(self) -> None:
+        sp1 = ObjectMetadataLibrary.SerializableProperty(prop_name='name', prop_type=str, custom_names={})
+        sp2 = ObjectMetadataLibrary.SerializableProperty(prop_name='name', prop_type=str, custom_names={})
+        sp3 = ObjectMetadataLibrary.SerializableProperty(prop_name='title', prop_type=str, custom_names={})
+        self.assertEqual(sp1, sp2)
+        self.assertEqual(hash(sp1), hash(sp2))
+        self.assertNotEqual(sp1, sp3)
+        self.assertEqual(len({sp1, sp2, sp3}), 2)
+
+    def test_slots(self) -> None:
+        sp = ObjectMetadataLibrary.SerializableProperty(prop_name='name', prop_type=str, custom_names={})
+        self.assertFalse(hasattr(sp, '__dict__'))
+        with self.assertRaises(AttributeError):
+            sp.unknown = True  # type:ignore[attr-defined]
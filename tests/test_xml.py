@@ -20,9 +20,11 @@
 import logging
 import os
 from copy import deepcopy
+from unittest.mock import patch
 
 from defusedxml import ElementTree as SafeElementTree
 
+from serializable import _xml_child_keys
 from serializable.formatters import (
     CamelCasePropertyNameFormatter,
     CurrentFormatter,
@@ -32,6 +34,8 @@ from serializable.formatters import (
 from tests.base import FIXTURES_DIRECTORY, BaseTestCase, DeepCompareMixin
 from tests.model import (
     Book,
+    BookEdition,
+    BookEditionHelper,
     SchemaVersion2,
     SchemaVersion3,
     SchemaVersion4,
@@ -135,6 +139,13 @@ class TestXml(BaseTestCase, DeepCompareMixin):
         with open(os.path.join(FIXTURES_DIRECTORY, 'the-phoenix-project-bookedition-none.xml')) as expected_xml:
             self.assertEqualXml(expected_xml.read(), ThePhoenixProject_attr_serialized_none.as_xml(SchemaVersion4))
 
+    def test_serialize_attribute_helper_gets_plain_element_name(self) -> None:
+        CurrentFormatter.formatter = CamelCasePropertyNameFormatter
+        with patch.object(BookEditionHelper, 'xml_normalize', return_value=2) as xml_normalize:
+            xml = BookEdition(number=2, name='Second').as_xml(xmlns='urn:ns')
+        self.assertEqual(xml_normalize.call_args.kwargs['element_name'], 'number')
+        self.assertIn('number="2"', xml)
+
     # endregion test_serialize
 
     # region test_deserialize
@@ -274,4 +285,19 @@ class TestXml(BaseTestCase, DeepCompareMixin):
             actual = Book.from_xml(fixture_xml)
         self.assertDeepEqual(expected, actual)
 
+    def test_deserialize_rejected_documents_are_not_memoized(self) -> None:
+        CurrentFormatter.formatter = CamelCasePropertyNameFormatter
+        with open(os.path.join(FIXTURES_DIRECTORY, 'the-phoenix-project-camel-case-1-v4.xml')) as input_xml:
+            xml = input_xml.read()
+        before: Book = Book.from_xml(data=SafeElementTree.fromstring(xml))
+        known_tags = set(_xml_child_keys(Book))
+        for i in range(20):
+            with self.assertRaises(ValueError):
+                Book.from_xml(data=SafeElementTree.fromstring(f'<book xmlns="urn:x{i}"><bogus{i}/></book>'))
+            with self.assertRaises(ValueError):
+                Book.from_xml(data=SafeElementTree.fromstring(f'<book><x:title xmlns:x="urn:y{i}"/></book>'))
+        self.assertEqual(known_tags, set(_xml_child_keys(Book)))
+        after: Book = Book.from_xml(data=SafeElementTree.fromstring(xml))
+        self.assertEqual(before.as_json(), after.as_json())
+
     # region test_deserialize